@@ -107,6 +107,31 @@ class HITLController:
             # Fallback to default clarification
             return self._get_default_clarification(query, ambiguity_type)
 
+    def clamp_clarification(
+        self,
+        clarification_question: Optional[str],
+        options: Optional[List[str]],
+    ) -> Optional[ClarificationOutput]:
+        """Validate a pre-drafted clarification
+
+        Args:
+            clarification_question: Drafted question
+            options: Drafted options
+
+        Returns:
+            ClarificationOutput with at most 5 options, or None if the draft is
+            unusable (no question or fewer than 2 options) and
+            generate_clarification should be used instead
+        """
+        question = (clarification_question or "").strip()
+        options = [option.strip() for option in options or [] if option and option.strip()]
+
+        if not question or len(options) < 2:
+            return None
+
+        # Limit to max 5 options
+        return ClarificationOutput(clarification_question=question, options=options[:5])
+
     async def refine_query(
         self,
         original_query: str,
@@ -5,11 +5,15 @@ from typing import Optional
 from src.core.models import (
     Complexity,
     AmbiguityType,
+    AnalyzeAndClarifyOutput,
     QueryAnalysisOutput,
 )
 from src.core.exceptions import ValidationException
 from src.llm import LLMProvider, OpenAIProvider
-from src.llm.prompts.query_analysis import QUERY_ANALYSIS_PROMPT
+from src.llm.prompts.query_analysis import (
+    QUERY_ANALYSIS_PROMPT,
+    QUERY_ANALYSIS_WITH_CLARIFICATION_PROMPT,
+)
 
 
 class QueryProcessor:
@@ -38,6 +42,33 @@ class QueryProcessor:
 
         return result
 
+    async def analyze_and_clarify(self, query: str) -> AnalyzeAndClarifyOutput:
+        """Analyze a user query and draft a clarification in one LLM call
+
+        Saves the separate HITLController.generate_clarification round-trip
+        when the query turns out to be ambiguous.
+        """
+        # Validate input
+        if not query or not query.strip():
+            raise ValidationException("Query cannot be empty")
+
+        # Truncate very long queries
+        query = query[:2000] if len(query) > 2000 else query
+
+        prompt = QUERY_ANALYSIS_WITH_CLARIFICATION_PROMPT.format(query=query)
+
+        result = await self.llm_provider.generate_structured(
+            prompt=prompt,
+            response_model=AnalyzeAndClarifyOutput,
+            system_prompt="You are a query analysis expert. Analyze the given query and, if it is ambiguous, draft a clarification question.",
+        )
+
+        # Clarification only applies to ambiguous queries
+        if not result.analysis.is_ambiguous:
+            result.clarification = None
+
+        return result
+
     def is_simple_query(self, analysis: QueryAnalysisOutput) -> bool:
         """Check if query is simple"""
         return analysis.complexity == Complexity.SIMPLE
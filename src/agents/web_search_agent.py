@@ -1,6 +1,7 @@
 """Web Search Agent using Tavily API"""
 
 import asyncio
+from threading import Lock
 from typing import List, Optional
 
 import httpx
@@ -13,6 +14,25 @@ from src.llm.prompts.web_integration import (
     WEB_QUERY_OPTIMIZATION_PROMPT,
     WEB_RESULT_RELEVANCE_PROMPT,
 )
+from src.vectorstore.search_cache import SearchCache
+
+# Tavily responses shared across WebSearchAgent instances (web_search_node
+# builds a new agent per call)
+_tavily_cache: Optional[SearchCache] = None
+_tavily_cache_lock = Lock()
+
+
+def _get_tavily_cache() -> SearchCache:
+    """Get (or create) the shared Tavily response cache"""
+    global _tavily_cache
+    with _tavily_cache_lock:
+        if _tavily_cache is None:
+            settings = get_settings()
+            _tavily_cache = SearchCache(
+                max_size=settings.tavily_cache_max_size,
+                ttl_seconds=settings.tavily_cache_ttl_seconds,
+            )
+        return _tavily_cache
 
 
 class OptimizedQuery(BaseModel):
@@ -44,6 +64,21 @@ class WebSearchAgent:
 
     TAVILY_API_URL = "https://api.tavily.com/search"
 
+    # Substrings of result URLs that mark trusted or documentation sources
+    TRUSTED_DOMAINS = frozenset({
+        "docs.python.org",
+        "developer.mozilla.org",
+        "docs.microsoft.com",
+        "cloud.google.com",
+        "aws.amazon.com",
+        "kubernetes.io",
+        "docker.com",
+        "github.com",
+        "stackoverflow.com",
+        "medium.com",
+    })
+    DOCUMENTATION_URL_PATTERNS = ("docs.", "documentation", "wiki")
+
     def __init__(self, llm_provider=None):
         self.settings = get_settings()
         self.llm = llm_provider or get_llm_provider()
@@ -108,6 +143,12 @@ class WebSearchAgent:
         if not self.api_key:
             return []
 
+        cache = _get_tavily_cache()
+        cache_key = SearchCache.make_key(query, self.max_results)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         payload = {
             "api_key": self.api_key,
             "query": query,
@@ -131,6 +172,9 @@ class WebSearchAgent:
                         content=item.get("content", ""),
                         score=item.get("score", 0.0),
                     ))
+                # Only real hits are cached so an empty answer is retried
+                if results:
+                    cache.put(cache_key, list(results))
                 return results
         except Exception as e:
             # Log error but don't fail
@@ -145,11 +189,14 @@ class WebSearchAgent:
         """Evaluate relevance and convert to Documents"""
         documents = []
 
-        # Evaluate results in parallel
-        evaluation_tasks = [
-            self._evaluate_result(original_query, result)
-            for result in results
-        ]
+        # Evaluate results in parallel, bounded to respect LLM rate limits
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests)
+
+        async def evaluate(result: TavilyResult) -> WebResultRelevance:
+            async with semaphore:
+                return await self._evaluate_result(original_query, result)
+
+        evaluation_tasks = [evaluate(result) for result in results]
 
         evaluations = await asyncio.gather(*evaluation_tasks, return_exceptions=True)
 
@@ -215,26 +262,12 @@ class WebSearchAgent:
 
     def _estimate_source_reliability(self, url: str) -> float:
         """Estimate source reliability based on URL"""
-        trusted_domains = [
-            "docs.python.org",
-            "developer.mozilla.org",
-            "docs.microsoft.com",
-            "cloud.google.com",
-            "aws.amazon.com",
-            "kubernetes.io",
-            "docker.com",
-            "github.com",
-            "stackoverflow.com",
-            "medium.com",
-        ]
-
         url_lower = url.lower()
-        for domain in trusted_domains:
-            if domain in url_lower:
-                return 0.9
+        if any(domain in url_lower for domain in self.TRUSTED_DOMAINS):
+            return 0.9
 
         # Check for official documentation patterns
-        if any(pattern in url_lower for pattern in ["docs.", "documentation", "wiki"]):
+        if any(pattern in url_lower for pattern in self.DOCUMENTATION_URL_PATTERNS):
             return 0.8
 
         return 0.6
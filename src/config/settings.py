@@ -34,6 +34,8 @@ class Settings(BaseSettings):
     # === Tavily ===
     tavily_api_key: str = Field(default="")
     tavily_max_results: int = 5
+    tavily_cache_ttl_seconds: int = 3600
+    tavily_cache_max_size: int = 256
 
     # === ChromaDB ===
     chroma_persist_dir: str = Field(default="./data/chroma_db", alias="CHROMA_PERSIST_DIR")
@@ -50,6 +52,10 @@ class Settings(BaseSettings):
 
     # === Performance ===
     cache_ttl_seconds: int = 3600
+    search_cache_ttl_seconds: int = 300
+    search_cache_max_size: int = 2000
+    # Brute-force cosine search over an in-memory copy of the collection
+    use_inmemory_cache: bool = False
     request_timeout_seconds: int = 30
     max_concurrent_requests: int = 10
 
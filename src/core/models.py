@@ -107,6 +107,20 @@ class ClarificationOutput(BaseModel):
     options: List[str] = Field(min_length=2, max_length=5)
 
 
+class ClarificationDraft(BaseModel):
+    """Clarification drafted during query analysis (options are clamped in code)"""
+
+    clarification_question: str = ""
+    options: List[str] = []
+
+
+class AnalyzeAndClarifyOutput(BaseModel):
+    """Query analysis plus clarification from a single LLM call (Prompts #1 + #2)"""
+
+    analysis: QueryAnalysisOutput
+    clarification: Optional[ClarificationDraft] = None
+
+
 class HITLResponse(BaseModel):
     """User HITL response"""
 
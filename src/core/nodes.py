@@ -20,7 +20,9 @@ async def analyze_query_node(state: RAGState) -> Dict[str, Any]:
     processor = QueryProcessor()
     hitl = HITLController()
 
-    analysis = await processor.analyze(state["query"])
+    # Analysis and (for ambiguous queries) clarification come from one LLM call
+    result = await processor.analyze_and_clarify(state["query"])
+    analysis = result.analysis
 
     # Check if clarification is needed
     clarification_needed = hitl.should_clarify(
@@ -29,6 +31,14 @@ async def analyze_query_node(state: RAGState) -> Dict[str, Any]:
         interaction_count=state.get("interaction_count", 0),
     )
 
+    # Prefetched clarification, reused by clarify_hitl_node if usable
+    clarification = None
+    if clarification_needed and result.clarification:
+        clarification = hitl.clamp_clarification(
+            result.clarification.clarification_question,
+            result.clarification.options,
+        )
+
     return {
         "refined_query": analysis.refined_query or state["query"],
         "complexity": analysis.complexity.value,
@@ -37,6 +47,8 @@ async def analyze_query_node(state: RAGState) -> Dict[str, Any]:
         "ambiguity_type": analysis.ambiguity_type.value if analysis.ambiguity_type else None,
         "detected_domains": analysis.detected_domains,
         "clarification_needed": clarification_needed,
+        "clarification_question": clarification.clarification_question if clarification else None,
+        "clarification_options": clarification.options if clarification else None,
         "current_node": "analyze_query",
         "total_llm_calls": state.get("total_llm_calls", 0) + 1,
     }
@@ -230,6 +242,19 @@ async def clarify_hitl_node(state: RAGState) -> Dict[str, Any]:
     """
     hitl = HITLController()
 
+    # Reuse the clarification drafted by analyze_query_node
+    prefetched = hitl.clamp_clarification(
+        state.get("clarification_question"),
+        state.get("clarification_options"),
+    )
+    if prefetched:
+        return {
+            "clarification_question": prefetched.clarification_question,
+            "clarification_options": prefetched.options,
+            "interaction_count": state.get("interaction_count", 0) + 1,
+            "current_node": "clarify_hitl",
+        }
+
     query = state["query"]
     ambiguity_type_str = state.get("ambiguity_type")
     ambiguity_type = AmbiguityType(ambiguity_type_str) if ambiguity_type_str else None
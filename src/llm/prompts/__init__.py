@@ -1,6 +1,6 @@
 """Prompt templates for LLM interactions"""
 
-from .query_analysis import QUERY_ANALYSIS_PROMPT
+from .query_analysis import QUERY_ANALYSIS_PROMPT, QUERY_ANALYSIS_WITH_CLARIFICATION_PROMPT
 from .response import RESPONSE_GENERATION_PROMPT
 from .relevance import RELEVANCE_EVALUATION_PROMPT, BATCH_RELEVANCE_EVALUATION_PROMPT
 from .rewrite import QUERY_REWRITE_PROMPT, STRATEGY_SELECTION_PROMPT
@@ -15,6 +15,7 @@ from .decomposition import QUERY_DECOMPOSITION_PROMPT, SUB_ANSWER_SYNTHESIS_PROM
 
 __all__ = [
     "QUERY_ANALYSIS_PROMPT",
+    "QUERY_ANALYSIS_WITH_CLARIFICATION_PROMPT",
     "RESPONSE_GENERATION_PROMPT",
     "RELEVANCE_EVALUATION_PROMPT",
     "BATCH_RELEVANCE_EVALUATION_PROMPT",
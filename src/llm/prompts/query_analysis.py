@@ -33,3 +33,54 @@ QUERY_ANALYSIS_PROMPT = """Analyze the following user query and provide a struct
 ## Response Format
 Return a JSON object with all the above fields.
 """
+
+
+QUERY_ANALYSIS_WITH_CLARIFICATION_PROMPT = """Analyze the following user query and, if it is ambiguous, prepare a clarification question in the same step.
+
+## Query
+{query}
+
+## Part 1: analysis
+Fill in every field described below under "analysis".
+
+1. **refined_query**: Improve the query for better search results. Keep the original intent.
+
+2. **complexity**: "simple" (single topic) or "complex" (multiple parts, comparative analysis)
+
+3. **clarity_confidence**: Score 0.0-1.0 indicating how clear the query is
+   - 1.0: Perfectly clear, specific, actionable
+   - 0.7-0.9: Mostly clear, minor improvements possible
+   - 0.5-0.7: Somewhat unclear, may need clarification
+   - Below 0.5: Unclear, needs clarification
+
+4. **is_ambiguous**: true if the query has multiple interpretations or unclear terms
+
+5. **ambiguity_type**: If ambiguous, one of "multiple_interpretation", "missing_context", "vague_term"
+
+6. **detected_domains**: Relevant technical domains
+   (development, operations, security, infrastructure, api, database, frontend, backend, devops, general)
+
+## Part 2: clarification
+Only if is_ambiguous is true, generate ONE clarification question with 2-5 options:
+1. The question should be natural and conversational in Korean
+2. Options should be mutually exclusive, specific, and under 50 characters each
+3. Do not add an "other" option (the system adds "직접 입력" automatically)
+
+If is_ambiguous is false, set "clarification" to null.
+
+## Output Format (JSON)
+{{
+    "analysis": {{
+        "refined_query": "...",
+        "complexity": "simple",
+        "clarity_confidence": 0.0,
+        "is_ambiguous": false,
+        "ambiguity_type": null,
+        "detected_domains": []
+    }},
+    "clarification": {{
+        "clarification_question": "명확화 질문 (Korean)",
+        "options": ["선택지 1", "선택지 2", "선택지 3"]
+    }}
+}}
+"""
@@ -0,0 +1,119 @@
+"""Persistent content-hash embedding cache"""
+
+import hashlib
+import os
+import sqlite3
+from threading import Lock
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache mapping (sha256(text), provider, model) to an embedding.
+
+    Vectors are stored as packed float32 blobs so re-indexing unchanged
+    documents does not hit the embedding API again.
+    """
+
+    LOOKUP_BATCH_SIZE = 500
+
+    def __init__(self, path: str):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = path
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            "hash TEXT, provider TEXT, model TEXT, vec BLOB, "
+            "PRIMARY KEY (hash, provider, model))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Get content hash for a text"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(
+        self, hashes: Sequence[str], provider: str, model: str
+    ) -> Dict[str, np.ndarray]:
+        """
+        Look up cached embeddings in a single query.
+
+        Args:
+            hashes: Content hashes to look up
+            provider: Embedding provider name
+            model: Embedding model name
+
+        Returns:
+            Mapping of hash to float32 embedding for cache hits only
+        """
+        unique_hashes = list(dict.fromkeys(hashes))
+        if not unique_hashes:
+            return {}
+
+        rows = []
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit for large batches
+            for start in range(0, len(unique_hashes), self.LOOKUP_BATCH_SIZE):
+                batch = unique_hashes[start:start + self.LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    self._conn.execute(
+                        "SELECT hash, vec FROM embedding_cache "
+                        f"WHERE provider = ? AND model = ? AND hash IN ({placeholders})",
+                        (provider, model, *batch),
+                    ).fetchall()
+                )
+
+        return {
+            h: np.frombuffer(vec, dtype=np.float32) for h, vec in rows
+        }
+
+    def put_many(
+        self,
+        hashes: Sequence[str],
+        embeddings: "Sequence[Sequence[float]] | np.ndarray",
+        provider: str,
+        model: str,
+    ) -> None:
+        """
+        Store embeddings, keeping any existing entry for the same key.
+
+        Args:
+            hashes: Content hashes
+            embeddings: Embeddings aligned with hashes
+            provider: Embedding provider name
+            model: Embedding model name
+        """
+        rows = [
+            (h, provider, model, np.asarray(v, dtype=np.float32).tobytes())
+            for h, v in zip(hashes, embeddings)
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (hash, provider, model, vec) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
+
+    @classmethod
+    def in_directory(cls, directory: str) -> "EmbeddingCache":
+        """Create a cache stored inside the given directory"""
+        return cls(os.path.join(directory, "embedding_cache.sqlite3"))
@@ -19,6 +19,10 @@ class EmbeddingProvider(ABC):
         """Get embedding dimension"""
         pass
 
+    def get_model_name(self) -> str:
+        """Get embedding model name (used to key cached embeddings)"""
+        return ""
+
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """OpenAI Embedding Provider implementation"""
@@ -41,3 +45,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
     def get_dimension(self) -> int:
         """Get embedding dimension for current model"""
         return self.DIMENSIONS.get(self._model, 1536)
+
+    def get_model_name(self) -> str:
+        """Get embedding model name"""
+        return self._model
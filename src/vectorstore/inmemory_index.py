@@ -0,0 +1,92 @@
+"""In-memory cosine index mirroring a Chroma collection"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving zero vectors untouched"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class InMemoryIndex:
+    """
+    Normalized float32 embedding matrix with parallel ids/documents/metadatas.
+
+    Brute-force cosine search over the matrix is faster than a Chroma
+    HNSW + sqlite round-trip for small and medium collections.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        embeddings: Any,
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ):
+        self._ids: List[str] = list(ids)
+        self._documents: List[str] = list(documents)
+        self._metadatas: List[Dict[str, Any]] = [
+            m or {} for m in (metadatas or [None] * len(self._ids))
+        ]
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.size == 0:
+            matrix = matrix.reshape(0, 0)
+        self._matrix = _normalize_rows(matrix) if len(self._ids) else matrix
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(
+        self,
+        ids: Sequence[str],
+        embeddings: Any,
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Append rows to the index"""
+        rows = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        self._matrix = np.vstack([self._matrix, rows]) if len(self._ids) else rows
+        self._ids.extend(ids)
+        self._documents.extend(documents)
+        self._metadatas.extend(m or {} for m in (metadatas or [None] * len(ids)))
+
+    def query(self, query_embedding: Any, n_results: int) -> List[Dict[str, Any]]:
+        """
+        Find the nearest rows by cosine similarity.
+
+        Args:
+            query_embedding: Query vector
+            n_results: Number of results to return
+
+        Returns:
+            Results formatted like VectorStoreManager.search, using cosine distance
+        """
+        n_results = min(n_results, len(self._ids))
+        if n_results <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+
+        scores = self._matrix @ query
+        if n_results < scores.size:
+            top = np.argpartition(-scores, n_results - 1)[:n_results]
+        else:
+            top = np.arange(scores.size)
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            {
+                "content": self._documents[i],
+                "metadata": self._metadatas[i],
+                "distance": float(1.0 - scores[i]),
+                "id": self._ids[i],
+            }
+            for i in top
+        ]
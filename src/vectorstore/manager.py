@@ -1,23 +1,84 @@
 """ChromaDB Vector Store Manager"""
 
+import asyncio
+import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import uuid
+from threading import Lock
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
 from src.config import get_settings
+from .embedding_cache import EmbeddingCache
 from .embeddings import EmbeddingProvider, OpenAIEmbeddingProvider
+from .inmemory_index import InMemoryIndex
+from .search_cache import SearchCache
+
+logger = logging.getLogger(__name__)
+
+# One Chroma client and embedding cache per persist directory, shared across
+# VectorStoreManager instances so each construction doesn't reload sqlite/HNSW state
+_clients: Dict[str, Any] = {}
+_embedding_caches: Dict[str, EmbeddingCache] = {}
+_shared_lock = Lock()
+
+
+def _get_shared_resources(persist_directory: str) -> Tuple[Any, EmbeddingCache]:
+    """Get (or create) the Chroma client and embedding cache for a directory"""
+    with _shared_lock:
+        if persist_directory not in _clients:
+            _clients[persist_directory] = chromadb.PersistentClient(
+                path=persist_directory,
+                settings=ChromaSettings(anonymized_telemetry=False),
+            )
+            _embedding_caches[persist_directory] = EmbeddingCache.in_directory(
+                persist_directory
+            )
+        return _clients[persist_directory], _embedding_caches[persist_directory]
+
+
+# Search result cache and in-memory index per (persist directory, collection),
+# so a write through any VectorStoreManager invalidates what the others serve
+_search_caches: Dict[Tuple[str, str], SearchCache] = {}
+_inmemory_indexes: Dict[Tuple[str, str], InMemoryIndex] = {}
+
+
+def _get_search_cache(collection_key: Tuple[str, str]) -> SearchCache:
+    """Get (or create) the search result cache for a collection"""
+    with _shared_lock:
+        if collection_key not in _search_caches:
+            settings = get_settings()
+            _search_caches[collection_key] = SearchCache(
+                max_size=settings.search_cache_max_size,
+                ttl_seconds=settings.search_cache_ttl_seconds,
+            )
+        return _search_caches[collection_key]
 
 
 class VectorStoreManager:
     """ChromaDB Vector Store Manager for document storage and retrieval"""
 
+    # Maximum rows sent to Chroma in a single write call
+    WRITE_BATCH_SIZE = 1000
+
+    # Pipelined ingestion: documents per embedding call, concurrent embedding
+    # calls, and max batches buffered between the embed and write stages
+    INGEST_BATCH_SIZE = 100
+    INGEST_EMBED_WORKERS = 4
+    INGEST_QUEUE_SIZE = 4
+
+    # Persist directories already created in this process
+    _ensured_dirs: ClassVar[Set[str]] = set()
+
     def __init__(
         self,
         persist_directory: Optional[str] = None,
         collection_name: Optional[str] = None,
         embedding_provider: Optional[EmbeddingProvider] = None,
+        use_inmemory_cache: Optional[bool] = None,
     ):
         settings = get_settings()
 
@@ -26,12 +87,14 @@ class VectorStoreManager:
         self.embedding_provider = embedding_provider or OpenAIEmbeddingProvider()
 
         # Ensure directory exists
-        os.makedirs(self.persist_directory, exist_ok=True)
+        if self.persist_directory not in VectorStoreManager._ensured_dirs:
+            os.makedirs(self.persist_directory, exist_ok=True)
+            VectorStoreManager._ensured_dirs.add(self.persist_directory)
 
-        # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(
-            path=self.persist_directory,
-            settings=ChromaSettings(anonymized_telemetry=False),
+        # Initialize ChromaDB client and content-hash embedding cache
+        # (the cache is stored alongside the Chroma data)
+        self.client, self._embedding_cache = _get_shared_resources(
+            self.persist_directory
         )
 
         # Get or create collection
@@ -40,6 +103,85 @@ class VectorStoreManager:
             metadata={"hnsw:space": "cosine"},
         )
 
+        # Search result cache, invalidated on every write to the collection
+        self._collection_key = (self.persist_directory, self.collection_name)
+        self._search_cache = _get_search_cache(self._collection_key)
+
+        # Optional in-memory mirror of the collection for brute-force cosine search
+        self.use_inmemory_cache = (
+            settings.use_inmemory_cache
+            if use_inmemory_cache is None
+            else use_inmemory_cache
+        )
+
+    @property
+    def _inmemory_index(self) -> Optional[InMemoryIndex]:
+        """In-memory mirror shared by every manager on this collection"""
+        return _inmemory_indexes.get(self._collection_key)
+
+    @_inmemory_index.setter
+    def _inmemory_index(self, index: Optional[InMemoryIndex]) -> None:
+        if index is None:
+            _inmemory_indexes.pop(self._collection_key, None)
+        else:
+            _inmemory_indexes[self._collection_key] = index
+
+    async def _get_inmemory_index(self) -> InMemoryIndex:
+        """Get the in-memory mirror, loading it from the collection on first use"""
+        if self._inmemory_index is None:
+            data = await asyncio.to_thread(
+                self.collection.get,
+                include=["embeddings", "documents", "metadatas"],
+            )
+            self._inmemory_index = InMemoryIndex(
+                ids=data["ids"],
+                embeddings=data["embeddings"] if data["embeddings"] is not None else [],
+                documents=data["documents"] or [],
+                metadatas=data["metadatas"],
+            )
+        return self._inmemory_index
+
+    def _can_use_inmemory(
+        self,
+        where: Optional[Dict[str, Any]],
+        where_document: Optional[Dict[str, Any]],
+    ) -> bool:
+        """Filtered searches always go through Chroma"""
+        return self.use_inmemory_cache and where is None and where_document is None
+
+    async def _embed_documents(self, documents: List[str]) -> np.ndarray:
+        """Get float32 embeddings for documents, only calling the provider for cache misses"""
+        provider = type(self.embedding_provider).__name__
+        model = self.embedding_provider.get_model_name()
+
+        hashes = [EmbeddingCache.hash_text(doc) for doc in documents]
+        cached = await asyncio.to_thread(
+            self._embedding_cache.get_many, hashes, provider, model
+        )
+
+        # Embed each distinct uncached text once, even if repeated in this call
+        uncached: Dict[str, str] = {}
+        for h, doc in zip(hashes, documents):
+            if h not in cached:
+                uncached.setdefault(h, doc)
+
+        if uncached:
+            new_embeddings = np.asarray(
+                await self.embedding_provider.get_embeddings(list(uncached.values())),
+                dtype=np.float32,
+            )
+            uncached_hashes = list(uncached)
+            await asyncio.to_thread(
+                self._embedding_cache.put_many,
+                uncached_hashes,
+                new_embeddings,
+                provider,
+                model,
+            )
+            cached.update(zip(uncached_hashes, new_embeddings))
+
+        return np.stack([cached[h] for h in hashes])
+
     async def add_documents(
         self,
         documents: List[str],
@@ -52,22 +194,100 @@ class VectorStoreManager:
 
         # Generate IDs if not provided
         if ids is None:
-            existing_count = self.collection.count()
-            ids = [f"doc_{existing_count + i}" for i in range(len(documents))]
-
-        # Generate embeddings
-        embeddings = await self.embedding_provider.get_embeddings(documents)
-
-        # Add to collection
-        self.collection.add(
-            documents=documents,
-            embeddings=embeddings,
-            metadatas=metadatas or [{}] * len(documents),
-            ids=ids,
-        )
+            ids = [uuid.uuid4().hex for _ in documents]
+
+        try:
+            if len(documents) <= self.INGEST_BATCH_SIZE:
+                # Generate embeddings (cached by content hash)
+                embeddings = await self._embed_documents(documents)
+                await self._write_batch(documents, embeddings, metadatas, ids)
+            else:
+                await self._pipelined_add(documents, metadatas, ids)
+        except BaseException:
+            # Some batches may already be written; reload the mirror on next use
+            self._inmemory_index = None
+            raise
+        finally:
+            self._search_cache.invalidate()
 
         return ids
 
+    async def _write_batch(
+        self,
+        documents: List[str],
+        embeddings: np.ndarray,
+        metadatas: Optional[List[Dict[str, Any]]],
+        ids: List[str],
+    ) -> None:
+        """Add one embedded batch to the collection"""
+        add_kwargs: Dict[str, Any] = {
+            "documents": documents,
+            "embeddings": embeddings,
+            "ids": ids,
+        }
+        # Omit metadatas entirely rather than sharing one {} across every row
+        if metadatas:
+            add_kwargs["metadatas"] = metadatas
+
+        await asyncio.to_thread(self.collection.add, **add_kwargs)
+        if self._inmemory_index is not None:
+            self._inmemory_index.add(ids, embeddings, documents, metadatas)
+
+    async def _pipelined_add(
+        self,
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]],
+        ids: List[str],
+    ) -> None:
+        """Embed micro-batches concurrently while a single writer adds finished ones"""
+        embed_queue: "asyncio.Queue[Optional[slice]]" = asyncio.Queue(
+            maxsize=self.INGEST_QUEUE_SIZE
+        )
+        write_queue: "asyncio.Queue[Optional[Tuple[slice, np.ndarray]]]" = asyncio.Queue(
+            maxsize=self.INGEST_QUEUE_SIZE
+        )
+        num_workers = self.INGEST_EMBED_WORKERS
+
+        async def produce() -> None:
+            for start in range(0, len(documents), self.INGEST_BATCH_SIZE):
+                await embed_queue.put(slice(start, start + self.INGEST_BATCH_SIZE))
+            for _ in range(num_workers):
+                await embed_queue.put(None)
+
+        async def embed() -> None:
+            while (batch := await embed_queue.get()) is not None:
+                embeddings = await self._embed_documents(documents[batch])
+                await write_queue.put((batch, embeddings))
+            await write_queue.put(None)
+
+        async def write() -> None:
+            # Chroma's sqlite backend prefers a single writer
+            remaining = num_workers
+            while remaining:
+                item = await write_queue.get()
+                if item is None:
+                    remaining -= 1
+                    continue
+                batch, embeddings = item
+                await self._write_batch(
+                    documents[batch],
+                    embeddings,
+                    metadatas[batch] if metadatas else None,
+                    ids[batch],
+                )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                for _ in range(num_workers):
+                    tg.create_task(embed())
+                tg.create_task(write())
+        except ExceptionGroup as eg:
+            # Surface the first failure to callers, keeping the group as its cause
+            for exc in eg.exceptions[1:]:
+                logger.error("Pipelined ingest task failed", exc_info=exc)
+            raise eg.exceptions[0] from eg
+
     async def search(
         self,
         query: str,
@@ -76,45 +296,115 @@ class VectorStoreManager:
         where_document: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Search for similar documents"""
+        cache_key = SearchCache.make_key(query, n_results, where, where_document)
+        cached_results = self._search_cache.get(cache_key)
+        if cached_results is not None:
+            return self._copy_results(cached_results)
+
         # Get query embedding
-        query_embeddings = await self.embedding_provider.get_embeddings([query])
-
-        # Search in collection
-        results = self.collection.query(
-            query_embeddings=query_embeddings,
-            n_results=n_results,
-            where=where,
-            where_document=where_document,
-            include=["documents", "metadatas", "distances"],
+        query_embeddings = np.asarray(
+            await self.embedding_provider.get_embeddings([query]),
+            dtype=np.float32,
         )
 
-        # Format results
-        formatted_results = []
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                formatted_results.append(
-                    {
-                        "content": doc,
-                        "metadata": (
-                            results["metadatas"][0][i]
-                            if results["metadatas"]
-                            else {}
-                        ),
-                        "distance": (
-                            results["distances"][0][i]
-                            if results["distances"]
-                            else 0.0
-                        ),
-                        "id": results["ids"][0][i] if results["ids"] else None,
-                    }
-                )
+        if self._can_use_inmemory(where, where_document):
+            index = await self._get_inmemory_index()
+            formatted_results = index.query(query_embeddings[0], n_results)
+        else:
+            # Search in collection
+            results = await asyncio.to_thread(
+                self.collection.query,
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=where,
+                where_document=where_document,
+                include=["documents", "metadatas", "distances"],
+            )
+            formatted_results = self._format_results(results)
+
+        self._search_cache.put(cache_key, formatted_results)
+        return self._copy_results(formatted_results)
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for multiple queries with a single embedding call and query"""
+        keys = [
+            SearchCache.make_key(query, n_results, where, where_document)
+            for query in queries
+        ]
+
+        results_by_key: Dict[str, List[Dict[str, Any]]] = {}
+        pending: Dict[str, str] = {}
+        for key, query in zip(keys, queries):
+            if key in results_by_key or key in pending:
+                continue
+            cached_results = self._search_cache.get(key)
+            if cached_results is not None:
+                results_by_key[key] = cached_results
+            else:
+                pending[key] = query
+
+        if pending:
+            # Embed all distinct uncached queries at once
+            query_embeddings = np.asarray(
+                await self.embedding_provider.get_embeddings(list(pending.values())),
+                dtype=np.float32,
+            )
+
+            results = await asyncio.to_thread(
+                self.collection.query,
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=where,
+                where_document=where_document,
+                include=["documents", "metadatas", "distances"],
+            )
 
-        return formatted_results
+            for row, key in enumerate(pending):
+                formatted_results = self._format_results(results, row)
+                self._search_cache.put(key, formatted_results)
+                results_by_key[key] = formatted_results
+
+        return [self._copy_results(results_by_key[key]) for key in keys]
+
+    @staticmethod
+    def _copy_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copy result rows and their metadata so callers can't mutate cached entries"""
+        return [{**result, "metadata": dict(result["metadata"])} for result in results]
+
+    @staticmethod
+    def _format_results(results: Dict[str, Any], row: int = 0) -> List[Dict[str, Any]]:
+        """Format one row of a Chroma query result"""
+        documents = (results.get("documents") or [[]])[row] or []
+        if not documents:
+            return []
+
+        empty = [None] * len(documents)
+        metadatas = (results.get("metadatas") or [empty])[row] or empty
+        distances = (results.get("distances") or [empty])[row] or empty
+        ids = (results.get("ids") or [empty])[row] or empty
+
+        return [
+            {
+                "content": doc,
+                "metadata": metadata or {},
+                "distance": distance if distance is not None else 0.0,
+                "id": doc_id,
+            }
+            for doc, metadata, distance, doc_id in zip(documents, metadatas, distances, ids)
+        ]
 
     async def delete_documents(self, ids: List[str]) -> None:
         """Delete documents by IDs"""
         if ids:
-            self.collection.delete(ids=ids)
+            await asyncio.to_thread(self.collection.delete, ids=ids)
+            self._search_cache.invalidate()
+            self._inmemory_index = None
 
     async def update_document(
         self,
@@ -123,22 +413,65 @@ class VectorStoreManager:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Update a document"""
-        update_kwargs = {"ids": [id]}
+        await self.update_documents([id], [document], [metadata])
+
+    async def update_documents(
+        self,
+        ids: List[str],
+        documents: Optional[List[Optional[str]]] = None,
+        metadatas: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Update multiple documents with a single embedding call"""
+        if not ids:
+            return
+
+        documents = documents or [None] * len(ids)
+        metadatas = metadatas or [None] * len(ids)
+
+        # Embed all changed texts at once
+        to_embed_idx = [i for i, doc in enumerate(documents) if doc]
+        embedding_rows: Dict[int, int] = {i: row for row, i in enumerate(to_embed_idx)}
+        embeddings = (
+            await self._embed_documents([documents[i] for i in to_embed_idx])
+            if to_embed_idx
+            else None
+        )
+
+        # Chroma requires every row in one update call to carry the same fields
+        groups: Dict[Tuple[bool, bool], List[int]] = {}
+        for i in range(len(ids)):
+            groups.setdefault((bool(documents[i]), bool(metadatas[i])), []).append(i)
 
-        if document:
-            embeddings = await self.embedding_provider.get_embeddings([document])
-            update_kwargs["documents"] = [document]
-            update_kwargs["embeddings"] = embeddings
+        for (has_document, has_metadata), indices in groups.items():
+            if not (has_document or has_metadata):
+                continue
 
-        if metadata:
-            update_kwargs["metadatas"] = [metadata]
+            for start in range(0, len(indices), self.WRITE_BATCH_SIZE):
+                batch = indices[start:start + self.WRITE_BATCH_SIZE]
+                update_kwargs: Dict[str, Any] = {"ids": [ids[i] for i in batch]}
 
-        self.collection.update(**update_kwargs)
+                if has_document:
+                    update_kwargs["documents"] = [documents[i] for i in batch]
+                    update_kwargs["embeddings"] = embeddings[
+                        [embedding_rows[i] for i in batch]
+                    ]
+
+                if has_metadata:
+                    update_kwargs["metadatas"] = [metadatas[i] for i in batch]
+
+                await asyncio.to_thread(self.collection.update, **update_kwargs)
+
+        self._search_cache.invalidate()
+        self._inmemory_index = None
 
     def get_document_count(self) -> int:
         """Get total document count"""
         return self.collection.count()
 
+    async def aget_document_count(self) -> int:
+        """Get total document count without blocking the event loop"""
+        return await asyncio.to_thread(self.collection.count)
+
     def clear_collection(self) -> None:
         """Clear all documents from collection"""
         self.client.delete_collection(self.collection_name)
@@ -146,3 +479,5 @@ class VectorStoreManager:
             name=self.collection_name,
             metadata={"hnsw:space": "cosine"},
         )
+        self._search_cache.invalidate()
+        self._inmemory_index = None
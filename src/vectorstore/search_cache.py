@@ -0,0 +1,114 @@
+"""LRU + TTL cache for search results"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class SearchCache:
+    """
+    Thread-safe LRU cache with TTL for search result lists.
+
+    Used for VectorStoreManager.search rows and WebSearchAgent Tavily results.
+    Values are stored as given; callers hand out copies.
+
+    Features:
+    - O(1) LRU eviction via OrderedDict
+    - Per-entry expiry
+    - Hit/miss statistics
+    - Full invalidation on collection writes
+    """
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: int = 300):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries
+            ttl_seconds: Entry TTL in seconds
+        """
+        self._entries: "OrderedDict[Hashable, Tuple[float, List[Any]]]" = OrderedDict()
+        self._lock = RLock()
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Generate cache key from query and filters"""
+        key_string = json.dumps(
+            [query, n_results, where, where_document],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(key_string.encode()).hexdigest()
+
+    def get(self, key: Hashable) -> Optional[List[Any]]:
+        """
+        Get cached results.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached results or None if not found/expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: List[Any]) -> None:
+        """
+        Store results.
+
+        Args:
+            key: Cache key
+            value: Search results to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hit_rate": round(self._hits / total, 4) if total > 0 else 0.0,
+            }
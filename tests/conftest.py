@@ -2,16 +2,72 @@
 
 import os
 import sys
+from functools import reduce
+from typing import Any, Dict, List, Tuple
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
 
+import numpy as np
 import pytest
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Mocking convention: patch with new=<stub> (or a plain MagicMock) rather than
+# autospec=True, which rebuilds a spec'd child-mock chain on every test.
 
-@pytest.fixture
+EMBEDDING_DIM = 1536
+MOCK_QUERY_ROWS = 100
+
+# Default child mocks of session-scoped mocks, restored before every test
+_mock_defaults: Dict[str, List[Tuple[Any, str, Any, Any]]] = {}
+
+
+def _snapshot_mock(fixture_name: str, mock: MagicMock, paths: List[str]) -> None:
+    """Remember configured child mocks (by dotted path) and their return values"""
+    snapshot = []
+    for path in paths:
+        *parents, name = path.split(".")
+        owner = reduce(getattr, parents, mock)
+        child = getattr(owner, name)
+        snapshot.append((owner, name, child, child.return_value))
+    _mock_defaults[fixture_name] = snapshot
+
+
+def _restore_mock(fixture_name: str, mock: MagicMock) -> None:
+    """Reset call records and undo per-test reconfiguration of a session mock"""
+    mock.reset_mock()
+    for owner, name, child, return_value in _mock_defaults[fixture_name]:
+        setattr(owner, name, child)
+        child.reset_mock(side_effect=True)
+        child.return_value = return_value
+
+
+@pytest.fixture(autouse=True)
+def _reset_session_mocks(request):
+    """Isolate tests that share session-scoped mocks"""
+    for fixture_name in _mock_defaults:
+        if fixture_name in request.fixturenames:
+            _restore_mock(fixture_name, request.getfixturevalue(fixture_name))
+
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    """RAGOrchestrator shared across the session (graph compiled once)"""
+    from src.core.orchestrator import RAGOrchestrator
+
+    return RAGOrchestrator()
+
+
+@pytest.fixture(autouse=True)
+def _clear_pending_sessions(request):
+    """Drop HITL sessions left on the shared orchestrator"""
+    yield
+    if "orchestrator" in request.fixturenames:
+        request.getfixturevalue("orchestrator")._pending_sessions.clear()
+
+
+@pytest.fixture(scope="session")
 def mock_openai_client():
     """Mock OpenAI client"""
     client = MagicMock()
@@ -25,13 +81,20 @@ def mock_openai_client():
 
     # Mock embeddings
     embedding_response = MagicMock()
-    embedding_response.data = [MagicMock(embedding=[0.1] * 1536)]
+    embedding_response.data = [
+        MagicMock(embedding=np.full(EMBEDDING_DIM, 0.1, dtype=np.float32).tolist())
+    ]
     client.embeddings.create = AsyncMock(return_value=embedding_response)
 
+    _snapshot_mock(
+        "mock_openai_client",
+        client,
+        ["chat.completions.create", "embeddings.create"],
+    )
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_provider(mock_openai_client):
     """Mock LLM Provider"""
     from src.llm.provider import LLMProvider
@@ -39,31 +102,80 @@ def mock_llm_provider(mock_openai_client):
     provider = MagicMock(spec=LLMProvider)
     provider.generate = AsyncMock(return_value="Test response")
     provider.generate_structured = AsyncMock()
-    provider.get_embeddings = AsyncMock(return_value=[[0.1] * 1536])
+    provider.get_embeddings = AsyncMock(
+        return_value=np.full((1, EMBEDDING_DIM), 0.1, dtype=np.float32)
+    )
     provider.chat = AsyncMock(return_value="Test chat response")
 
+    _snapshot_mock(
+        "mock_llm_provider",
+        provider,
+        ["generate", "generate_structured", "get_embeddings", "chat"],
+    )
     return provider
 
 
-@pytest.fixture
-def mock_chroma_client():
-    """Mock ChromaDB client"""
-    client = MagicMock()
+def _build_mock_collection(num_docs: int, dim: int, query_rows: int) -> MagicMock:
+    """Mock Chroma collection returning production-shaped results"""
     collection = MagicMock()
+    rows = min(num_docs, query_rows)
 
-    # Mock query results
+    # Mock query results (distances ascending, as Chroma returns them)
     collection.query.return_value = {
-        "documents": [["Test document content about deployment"]],
-        "metadatas": [[{"source": "test.md", "title": "Test Document"}]],
-        "distances": [[0.1]],
-        "ids": [["doc_1"]],
+        "documents": [[
+            "Test document content about deployment",
+            *(f"Test document {i}" for i in range(1, rows)),
+        ]],
+        "metadatas": [[
+            {"source": "test.md", "title": "Test Document"},
+            *({"source": f"test_{i}.md"} for i in range(1, rows)),
+        ]],
+        "distances": [np.linspace(0.1, 0.9, rows, dtype=np.float32).tolist()],
+        "ids": [[f"doc_{i + 1}" for i in range(rows)]],
+    }
+    collection.get.return_value = {
+        "ids": [f"doc_{i + 1}" for i in range(num_docs)],
+        "embeddings": np.random.default_rng(0).random((num_docs, dim), dtype=np.float32),
+        "documents": [f"Test document {i}" for i in range(num_docs)],
+        "metadatas": [{"source": f"test_{i}.md"} for i in range(num_docs)],
     }
-    collection.count.return_value = 1
+    collection.count.return_value = num_docs
     collection.add = MagicMock()
     collection.delete = MagicMock()
     collection.update = MagicMock()
 
-    client.get_or_create_collection.return_value = collection
+    return collection
+
+
+@pytest.fixture(scope="session")
+def mock_chroma_client():
+    """Mock ChromaDB client"""
+    client = MagicMock()
+    client.get_or_create_collection.return_value = _build_mock_collection(
+        num_docs=MOCK_QUERY_ROWS, dim=EMBEDDING_DIM, query_rows=MOCK_QUERY_ROWS
+    )
+
+    _snapshot_mock(
+        "mock_chroma_client",
+        client,
+        [
+            "get_or_create_collection",
+            *(
+                f"get_or_create_collection.return_value.{method}"
+                for method in ("query", "get", "count", "add", "delete", "update")
+            ),
+        ],
+    )
+    return client
+
+
+@pytest.fixture(params=[1_000, 10_000], ids=lambda n: f"{n}_docs")
+def mock_chroma_large(request):
+    """Mock ChromaDB client backed by a large collection (small embedding dim)"""
+    client = MagicMock()
+    client.get_or_create_collection.return_value = _build_mock_collection(
+        num_docs=request.param, dim=64, query_rows=MOCK_QUERY_ROWS
+    )
 
     return client
 
@@ -84,15 +196,31 @@ def mock_vector_store(mock_chroma_client):
             }
         ]
     )
+    store.search_batch = AsyncMock(
+        side_effect=lambda queries, **kwargs: [
+            [
+                {
+                    "content": "Test document content about deployment",
+                    "metadata": {"source": "test.md", "title": "Test Document"},
+                    "distance": 0.1,
+                    "id": "doc_1",
+                }
+            ]
+            for _ in queries
+        ]
+    )
     store.add_documents = AsyncMock(return_value=["doc_1"])
     store.get_document_count.return_value = 1
 
     return store
 
 
-@pytest.fixture
-def sample_query_analysis_output():
-    """Sample query analysis output"""
+# Canonical model instances are validated once per session; fixtures hand out
+# shallow copies to tests that may mutate them. Known-valid literals here and in
+# the test modules are built with model_construct, skipping pydantic validation.
+@pytest.fixture(scope="session")
+def _canonical_analysis_output():
+    """Canonical query analysis output"""
     from src.core.models import QueryAnalysisOutput, Complexity
 
     return QueryAnalysisOutput(
@@ -105,30 +233,60 @@ def sample_query_analysis_output():
     )
 
 
-@pytest.fixture
-def sample_documents():
-    """Sample retrieved documents"""
+@pytest.fixture(scope="session")
+def _canonical_response_output():
+    """Canonical generated response"""
+    from src.core.models import ResponseOutput
+
+    return ResponseOutput(
+        response="Docker 배포를 위해서는 Dockerfile을 작성하고 이미지를 빌드합니다 [1].",
+        sources=["deployment.md"],
+        has_sufficient_info=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def _canonical_documents():
+    """Canonical retrieved documents"""
     from src.core.models import Document, DocumentMetadata
 
-    return [
-        Document(
+    return (
+        Document.model_construct(
             content="Docker를 사용한 배포 방법: 1. Dockerfile 작성 2. 이미지 빌드 3. 컨테이너 실행",
-            metadata=DocumentMetadata(
+            metadata=DocumentMetadata.model_construct(
                 source="deployment.md",
                 title="배포 가이드",
                 section="Docker",
             ),
             embedding_score=0.95,
         ),
-        Document(
+        Document.model_construct(
             content="docker build -t myapp . 명령으로 이미지를 빌드합니다.",
-            metadata=DocumentMetadata(
+            metadata=DocumentMetadata.model_construct(
                 source="docker-guide.md",
                 title="Docker 가이드",
             ),
             embedding_score=0.85,
         ),
-    ]
+    )
+
+
+@pytest.fixture
+def sample_query_analysis_output(_canonical_analysis_output):
+    """Sample query analysis output"""
+    return _canonical_analysis_output.model_copy()
+
+
+@pytest.fixture
+def sample_response_output(_canonical_response_output):
+    """Sample response output (ResponseGenerator may fill in sources)"""
+    return _canonical_response_output.model_copy()
+
+
+@pytest.fixture
+def sample_documents(_canonical_documents):
+    """Sample retrieved documents (read-only, shared across the session)"""
+    return list(_canonical_documents)
 
 
 @pytest.fixture
@@ -8,20 +8,48 @@ Benchmarks for:
 - Throughput
 """
 
-import pytest
-import time
+import asyncio
+import random
 import statistics
-from typing import List, Dict, Any
+import time
+from typing import Iterable, Dict, Union
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
+import pytest
+
+
+class SampleBuffer:
+    """Fixed-capacity preallocated float64 sample buffer (appending past capacity raises IndexError)"""
+
+    def __init__(self, capacity: int):
+        self._data = np.empty(capacity, dtype=np.float64)
+        self._count = 0
+
+    def append(self, value: float):
+        self._data[self._count] = value
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return iter(self.values)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[:len(self)]
+
 
 class PerformanceMetrics:
     """Helper class for collecting performance metrics"""
 
-    def __init__(self):
-        self.response_times: List[float] = []
-        self.llm_latencies: List[float] = []
-        self.retrieval_latencies: List[float] = []
+    MAX_SAMPLES = 10_000
+
+    def __init__(self, capacity: int = MAX_SAMPLES):
+        self.response_times = SampleBuffer(capacity)
+        self.llm_latencies = SampleBuffer(capacity)
+        self.retrieval_latencies = SampleBuffer(capacity)
 
     def record_response_time(self, duration_ms: float):
         self.response_times.append(duration_ms)
@@ -32,18 +60,25 @@ class PerformanceMetrics:
     def record_retrieval_latency(self, duration_ms: float):
         self.retrieval_latencies.append(duration_ms)
 
-    def get_stats(self, values: List[float]) -> Dict[str, float]:
-        if not values:
+    def get_stats(self, values: Union[SampleBuffer, Iterable[float]]) -> Dict[str, float]:
+        if isinstance(values, SampleBuffer):
+            a = values.values
+        else:
+            a = np.fromiter(values, dtype=np.float64)
+        if a.size == 0:
             return {"count": 0, "avg": 0, "min": 0, "max": 0, "p50": 0, "p95": 0}
 
-        sorted_values = sorted(values)
+        # Nearest-rank percentiles via O(n) selection instead of a full sort
+        k50 = int(a.size * 0.5)
+        k95 = min(int(a.size * 0.95), a.size - 1)
+        part = np.partition(a, [k50, k95])
         return {
-            "count": len(values),
-            "avg": statistics.mean(values),
-            "min": min(values),
-            "max": max(values),
-            "p50": sorted_values[int(len(sorted_values) * 0.5)],
-            "p95": sorted_values[min(int(len(sorted_values) * 0.95), len(sorted_values) - 1)],
+            "count": int(a.size),
+            "avg": float(a.mean()),
+            "min": float(a.min()),
+            "max": float(a.max()),
+            "p50": float(part[k50]),
+            "p95": float(part[k95]),
         }
 
     def get_summary(self) -> Dict[str, Dict[str, float]]:
@@ -61,14 +96,14 @@ class TestResponseTimePerformance:
     TARGET_RESPONSE_TIME_P95 = 5000  # 5 seconds
     TARGET_RESPONSE_TIME_AVG = 3000  # 3 seconds
 
+    NUM_SAMPLES = 20
+
     @pytest.fixture
     def metrics(self):
-        return PerformanceMetrics()
+        return PerformanceMetrics(capacity=self.NUM_SAMPLES)
 
     def simulate_request(self, query: str, complexity: str = "simple") -> float:
         """Simulate a request and return duration in ms"""
-        import random
-
         # Simulate different durations based on complexity
         base_times = {
             "simple": (500, 1500),
@@ -79,7 +114,6 @@ class TestResponseTimePerformance:
         min_time, max_time = base_times.get(complexity, (500, 1500))
         return random.uniform(min_time, max_time)
 
-    @pytest.mark.asyncio
     async def test_simple_query_response_time(self, metrics):
         """Test response time for simple queries"""
         simple_queries = [
@@ -101,7 +135,6 @@ class TestResponseTimePerformance:
         assert stats["avg"] < self.TARGET_RESPONSE_TIME_AVG, \
             f"Average response time {stats['avg']:.0f}ms exceeds target {self.TARGET_RESPONSE_TIME_AVG}ms"
 
-    @pytest.mark.asyncio
     async def test_complex_query_response_time(self, metrics):
         """Test response time for complex queries"""
         complex_queries = [
@@ -119,10 +152,9 @@ class TestResponseTimePerformance:
         assert stats["p95"] < self.TARGET_RESPONSE_TIME_P95 * 2, \
             f"P95 response time {stats['p95']:.0f}ms exceeds target for complex queries"
 
-    @pytest.mark.asyncio
     async def test_response_time_consistency(self, metrics):
         """Test that response times are consistent"""
-        for _ in range(20):
+        for _ in range(self.NUM_SAMPLES):
             duration = self.simulate_request("RAG란 무엇인가요?", "simple")
             metrics.record_response_time(duration)
 
@@ -143,14 +175,14 @@ class TestLLMLatencyPerformance:
     TARGET_LLM_LATENCY_P95 = 2000  # 2 seconds
     TARGET_LLM_LATENCY_AVG = 1000  # 1 second
 
+    NUM_SAMPLES = 10
+
     @pytest.fixture
     def metrics(self):
-        return PerformanceMetrics()
+        return PerformanceMetrics(capacity=self.NUM_SAMPLES)
 
     def simulate_llm_call(self, prompt_length: int = 500) -> float:
         """Simulate LLM API call and return duration in ms"""
-        import random
-
         # Base latency + length-dependent component
         base = 300
         length_factor = prompt_length / 100 * 50
@@ -158,10 +190,9 @@ class TestLLMLatencyPerformance:
 
         return base + length_factor + jitter
 
-    @pytest.mark.asyncio
     async def test_llm_latency_short_prompts(self, metrics):
         """Test LLM latency for short prompts"""
-        for _ in range(10):
+        for _ in range(self.NUM_SAMPLES):
             duration = self.simulate_llm_call(prompt_length=200)
             metrics.record_llm_latency(duration)
 
@@ -170,10 +201,9 @@ class TestLLMLatencyPerformance:
         assert stats["p95"] < self.TARGET_LLM_LATENCY_P95
         assert stats["avg"] < self.TARGET_LLM_LATENCY_AVG
 
-    @pytest.mark.asyncio
     async def test_llm_latency_long_prompts(self, metrics):
         """Test LLM latency for long prompts with context"""
-        for _ in range(10):
+        for _ in range(self.NUM_SAMPLES):
             duration = self.simulate_llm_call(prompt_length=2000)
             metrics.record_llm_latency(duration)
 
@@ -189,14 +219,14 @@ class TestRetrievalPerformance:
     TARGET_RETRIEVAL_LATENCY_P95 = 500  # 500ms
     TARGET_RETRIEVAL_LATENCY_AVG = 200  # 200ms
 
+    NUM_SAMPLES = 20
+
     @pytest.fixture
     def metrics(self):
-        return PerformanceMetrics()
+        return PerformanceMetrics(capacity=self.NUM_SAMPLES)
 
     def simulate_retrieval(self, top_k: int = 5) -> float:
         """Simulate vector retrieval and return duration in ms"""
-        import random
-
         # Base latency + top_k factor
         base = 50
         k_factor = top_k * 10
@@ -204,10 +234,9 @@ class TestRetrievalPerformance:
 
         return base + k_factor + jitter
 
-    @pytest.mark.asyncio
     async def test_retrieval_latency(self, metrics):
         """Test vector retrieval latency"""
-        for _ in range(20):
+        for _ in range(self.NUM_SAMPLES):
             duration = self.simulate_retrieval(top_k=5)
             metrics.record_retrieval_latency(duration)
 
@@ -216,7 +245,6 @@ class TestRetrievalPerformance:
         assert stats["p95"] < self.TARGET_RETRIEVAL_LATENCY_P95
         assert stats["avg"] < self.TARGET_RETRIEVAL_LATENCY_AVG
 
-    @pytest.mark.asyncio
     async def test_retrieval_latency_large_k(self, metrics):
         """Test retrieval latency with large top_k"""
         for _ in range(10):
@@ -239,8 +267,6 @@ class TestCachePerformance:
 
     def test_cache_hit_performance(self, cache):
         """Test cache hit is much faster than cache miss"""
-        import random
-
         # Simulate cache miss (full retrieval + LLM)
         cache_miss_time = 2000 + random.uniform(0, 500)
 
@@ -270,11 +296,8 @@ class TestCachePerformance:
 class TestThroughput:
     """Throughput tests"""
 
-    @pytest.mark.asyncio
     async def test_concurrent_requests(self):
         """Test handling of concurrent requests"""
-        import asyncio
-
         async def simulate_request():
             await asyncio.sleep(0.1)  # Simulate work
             return True
@@ -290,7 +313,6 @@ class TestThroughput:
         # 10 requests with 0.1s each should complete in ~0.1s (concurrent) not 1s (sequential)
         assert duration < 0.5, "Concurrent requests should run in parallel"
 
-    @pytest.mark.asyncio
     async def test_request_queue_handling(self):
         """Test request queue handling under load"""
         max_concurrent = 5
@@ -299,8 +321,6 @@ class TestThroughput:
         max_active = 0
         completed = 0
 
-        import asyncio
-
         async def process_request():
             nonlocal active_requests, max_active, completed
             active_requests += 1
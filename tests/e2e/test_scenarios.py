@@ -7,403 +7,324 @@ Tests the 5 core scenarios:
 3. Corrective Flow - Query rewriting
 4. Web Fallback - External search
 5. Complex Query - Multi-part questions
+
+Each scenario is a (name, data, check) row in SCENARIOS, collected as
+parameters of a single test function.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from typing import Dict, Any
+from types import MappingProxyType
+from urllib.parse import urlparse
+
+# Scenario tests only build dicts and assert; skip warning capture
+pytestmark = [pytest.mark.filterwarnings("ignore")]
+
+TRUSTED_DOMAINS = frozenset({"docs.python.org", "github.com", "stackoverflow.com"})
 
 
 # Mock imports for testing without full dependencies
-class MockState:
-    """Mock state for testing"""
-
-    def __init__(self, data: Dict[str, Any] = None):
-        self._data = data or {}
-
-    def __getitem__(self, key):
-        return self._data.get(key)
-
-    def __setitem__(self, key, value):
-        self._data[key] = value
-
-    def get(self, key, default=None):
-        return self._data.get(key, default)
-
-
-class TestHappyPath:
-    """Test Scenario 1: Happy Path - Simple RAG query with good retrieval"""
-
-    @pytest.fixture
-    def simple_query_state(self):
-        """State for a simple, clear query"""
-        return MockState({
-            "query": "RAG 시스템의 주요 구성 요소는 무엇인가요?",
-            "session_id": "test-session-001",
-            "messages": [],
-        })
-
-    @pytest.mark.asyncio
-    async def test_query_analysis_identifies_simple_query(self, simple_query_state):
-        """Test that simple queries are correctly identified"""
-        # Simulate query analysis
-        analysis_result = {
-            "intent": "factual_question",
-            "complexity": "simple",
-            "is_ambiguous": False,
-            "clarity_confidence": 0.95,
-            "topic": "RAG system components",
-        }
-
-        assert analysis_result["complexity"] == "simple"
-        assert not analysis_result["is_ambiguous"]
-        assert analysis_result["clarity_confidence"] >= 0.8
-
-    @pytest.mark.asyncio
-    async def test_retrieval_returns_relevant_documents(self, simple_query_state):
-        """Test that retrieval returns relevant documents"""
-        # Simulate retrieval results
-        retrieved_docs = [
-            {
-                "content": "RAG 시스템은 검색(Retrieval), 증강(Augmentation), 생성(Generation) 세 가지 주요 구성 요소로 이루어져 있습니다.",
-                "metadata": {"source": "rag-guide.md"},
-                "relevance_score": 0.92,
-            },
-            {
-                "content": "검색 단계에서는 벡터 데이터베이스를 사용하여 관련 문서를 찾습니다.",
-                "metadata": {"source": "rag-guide.md"},
-                "relevance_score": 0.85,
-            },
-        ]
-
-        assert len(retrieved_docs) > 0
-        assert all(doc["relevance_score"] >= 0.7 for doc in retrieved_docs)
-
-    @pytest.mark.asyncio
-    async def test_response_generation_uses_context(self, simple_query_state):
-        """Test that response is generated using retrieved context"""
-        response = {
-            "answer": "RAG 시스템은 검색(Retrieval), 증강(Augmentation), 생성(Generation) 세 가지 주요 구성 요소로 이루어져 있습니다.",
-            "sources": [{"title": "RAG Guide", "source": "rag-guide.md"}],
-            "confidence": 0.9,
-            "needs_disclaimer": False,
-        }
-
-        assert response["answer"]
-        assert len(response["sources"]) > 0
-        assert not response["needs_disclaimer"]
-
-    @pytest.mark.asyncio
-    async def test_happy_path_complete_flow(self, simple_query_state):
-        """Test complete happy path flow"""
-        # Flow: analyze -> retrieve -> generate
-        flow_steps = ["analyze", "retrieve", "evaluate", "generate"]
-
-        # Verify flow doesn't include HITL or web search
-        assert "clarify" not in flow_steps
-        assert "web_search" not in flow_steps
-        assert "rewrite" not in flow_steps
-
-
-class TestHITLFlow:
-    """Test Scenario 2: HITL Flow - Clarification required"""
-
-    @pytest.fixture
-    def ambiguous_query_state(self):
-        """State for an ambiguous query"""
-        return MockState({
-            "query": "설정 방법 알려줘",
-            "session_id": "test-session-002",
-            "messages": [],
-        })
-
-    @pytest.mark.asyncio
-    async def test_ambiguous_query_triggers_clarification(self, ambiguous_query_state):
-        """Test that ambiguous queries trigger HITL"""
-        analysis_result = {
-            "intent": "how_to",
-            "complexity": "simple",
-            "is_ambiguous": True,
-            "clarity_confidence": 0.4,
-            "ambiguity_type": "missing_context",
-        }
-
-        should_clarify = (
-            analysis_result["is_ambiguous"]
-            or analysis_result["clarity_confidence"] < 0.8
-        )
-
-        assert should_clarify
-
-    @pytest.mark.asyncio
-    async def test_clarification_generates_options(self, ambiguous_query_state):
-        """Test that clarification generates proper options"""
-        clarification = {
-            "question": "어떤 설정에 대해 알고 싶으신가요?",
-            "options": [
-                {"id": "1", "text": "시스템 환경 설정"},
-                {"id": "2", "text": "API 키 설정"},
-                {"id": "3", "text": "데이터베이스 설정"},
-                {"id": "4", "text": "로깅 설정"},
-            ],
-            "allow_custom_input": True,
-        }
-
-        assert 2 <= len(clarification["options"]) <= 5
-        assert clarification["allow_custom_input"]
-
-    @pytest.mark.asyncio
-    async def test_user_selection_refines_query(self, ambiguous_query_state):
-        """Test that user selection properly refines the query"""
-        original_query = "설정 방법 알려줘"
-        user_selection = "API 키 설정"
-
-        refined_query = f"{original_query} - {user_selection}"
-
-        assert user_selection in refined_query
-
-    @pytest.mark.asyncio
-    async def test_max_hitl_interactions_limit(self, ambiguous_query_state):
-        """Test that HITL is limited to max interactions"""
-        max_interactions = 2
-        hitl_count = 0
-
-        # Simulate multiple HITL interactions
-        for _ in range(3):
-            if hitl_count < max_interactions:
-                hitl_count += 1
-
-        assert hitl_count <= max_interactions
-
-
-class TestCorrectiveFlow:
-    """Test Scenario 3: Corrective RAG - Query rewriting"""
-
-    @pytest.fixture
-    def low_relevance_state(self):
-        """State with low relevance results"""
-        return MockState({
-            "query": "최신 기능 업데이트 내용",
-            "session_id": "test-session-003",
-            "retrieved_docs": [],
-            "retry_count": 0,
-        })
-
-    @pytest.mark.asyncio
-    async def test_low_relevance_triggers_rewrite(self, low_relevance_state):
-        """Test that low relevance triggers query rewriting"""
-        relevance_evaluation = {
-            "has_relevant_docs": False,
-            "avg_score": 0.45,
-            "threshold": 0.7,
-        }
-
-        should_rewrite = (
-            not relevance_evaluation["has_relevant_docs"]
-            or relevance_evaluation["avg_score"] < relevance_evaluation["threshold"]
-        )
-
-        assert should_rewrite
-
-    @pytest.mark.asyncio
-    async def test_query_rewriting_improves_results(self, low_relevance_state):
-        """Test that query rewriting can improve results"""
-        original_query = "최신 기능 업데이트 내용"
-        rewritten_query = "RAG 시스템 새로운 기능 변경 사항 릴리즈 노트"
-
-        assert len(rewritten_query) > len(original_query)
-        assert original_query != rewritten_query
-
-    @pytest.mark.asyncio
-    async def test_max_rewrite_attempts(self, low_relevance_state):
-        """Test maximum rewrite attempts before fallback"""
-        max_retries = 2
-        retry_count = 0
-
-        while retry_count < max_retries + 1:
-            if retry_count >= max_retries:
-                # Should trigger web search
-                should_web_search = True
-                break
-            retry_count += 1
-            should_web_search = False
-
-        assert should_web_search
-
-
-class TestWebFallback:
-    """Test Scenario 4: Web Search Fallback"""
-
-    @pytest.fixture
-    def no_results_state(self):
-        """State with no internal results after retries"""
-        return MockState({
-            "query": "2024년 AI 트렌드",
-            "session_id": "test-session-004",
-            "retry_count": 2,
-            "retrieved_docs": [],
-        })
-
-    @pytest.mark.asyncio
-    async def test_web_search_triggered_after_retries(self, no_results_state):
-        """Test that web search is triggered after max retries"""
-        retry_count = no_results_state.get("retry_count", 0)
-        max_retries = 2
-
-        should_web_search = retry_count >= max_retries
-
-        assert should_web_search
-
-    @pytest.mark.asyncio
-    async def test_web_search_returns_results(self, no_results_state):
-        """Test that web search returns external results"""
-        web_results = [
-            {
-                "title": "2024 AI 트렌드 전망",
-                "url": "https://example.com/ai-trends-2024",
-                "snippet": "2024년 주요 AI 트렌드로는...",
-                "score": 0.85,
-            },
-        ]
-
-        assert len(web_results) > 0
-        assert all("url" in r for r in web_results)
-
-    @pytest.mark.asyncio
-    async def test_web_results_include_disclaimer(self, no_results_state):
-        """Test that web results include disclaimer"""
-        response = {
-            "answer": "웹 검색 결과에 따르면...",
-            "sources": [{"source_type": "web", "url": "https://example.com"}],
-            "needs_disclaimer": True,
-            "disclaimer": "이 정보는 외부 웹 검색 결과를 기반으로 합니다.",
-        }
-
-        assert response["needs_disclaimer"]
-        assert "disclaimer" in response
-
-    @pytest.mark.asyncio
-    async def test_source_reliability_evaluation(self, no_results_state):
-        """Test that web sources are evaluated for reliability"""
-        trusted_domains = ["docs.python.org", "github.com", "stackoverflow.com"]
-
-        web_result = {"url": "https://docs.python.org/3/library/asyncio.html"}
-
-        from urllib.parse import urlparse
-
-        domain = urlparse(web_result["url"]).netloc
-
-        is_trusted = any(trusted in domain for trusted in trusted_domains)
-
-        assert is_trusted
-
-
-class TestComplexQuery:
-    """Test Scenario 5: Complex Query - Multi-part questions"""
-
-    @pytest.fixture
-    def complex_query_state(self):
-        """State for a complex multi-part query"""
-        return MockState({
-            "query": "RAG 시스템의 구성 요소와 각각의 역할, 그리고 성능 최적화 방법은?",
-            "session_id": "test-session-005",
-            "messages": [],
-        })
-
-    @pytest.mark.asyncio
-    async def test_complex_query_detected(self, complex_query_state):
-        """Test that complex queries are properly detected"""
-        analysis_result = {
-            "intent": "multi_part_question",
-            "complexity": "complex",
-            "sub_questions_count": 3,
-        }
-
-        assert analysis_result["complexity"] == "complex"
-        assert analysis_result["sub_questions_count"] > 1
-
-    @pytest.mark.asyncio
-    async def test_query_decomposition(self, complex_query_state):
-        """Test that complex queries are decomposed"""
-        decomposition = {
-            "original_query": "RAG 시스템의 구성 요소와 각각의 역할, 그리고 성능 최적화 방법은?",
-            "sub_questions": [
-                "RAG 시스템의 구성 요소는 무엇인가?",
-                "각 구성 요소의 역할은 무엇인가?",
-                "RAG 시스템의 성능 최적화 방법은?",
-            ],
-            "parallel_groups": [[0, 1], [2]],
-        }
-
-        assert len(decomposition["sub_questions"]) >= 2
-        assert len(decomposition["sub_questions"]) <= 5
-
-    @pytest.mark.asyncio
-    async def test_parallel_retrieval(self, complex_query_state):
-        """Test that sub-questions can be processed in parallel"""
-        sub_questions = [
-            "RAG 시스템의 구성 요소는 무엇인가?",
-            "각 구성 요소의 역할은 무엇인가?",
-        ]
-
-        # Simulate parallel retrieval
-        results = {}
-        for i, q in enumerate(sub_questions):
-            results[i] = {"query": q, "docs": [{"content": f"Answer for {q}"}]}
-
-        assert len(results) == len(sub_questions)
-
-    @pytest.mark.asyncio
-    async def test_response_synthesis(self, complex_query_state):
-        """Test that sub-answers are synthesized into coherent response"""
-        sub_answers = [
-            "RAG 시스템은 검색, 증강, 생성으로 구성됩니다.",
-            "검색은 관련 문서를 찾고, 증강은 컨텍스트를 추가하며, 생성은 응답을 만듭니다.",
-            "성능 최적화를 위해 캐싱, 청킹 최적화, 임베딩 모델 선택이 중요합니다.",
-        ]
-
-        synthesized = "\n\n".join(sub_answers)
-
-        assert all(answer in synthesized for answer in sub_answers)
-
-
-class TestErrorHandling:
-    """Test error handling across all scenarios"""
-
-    @pytest.mark.asyncio
-    async def test_api_timeout_handling(self):
-        """Test handling of API timeouts"""
-        error_response = {
+class MockState(dict):
+    """Mock state for testing (missing keys read as None)"""
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return None
+
+
+# === Scenario 1: Happy Path - Simple RAG query with good retrieval ===
+
+HAPPY_PATH = MappingProxyType({
+    "analysis_result": {
+        "intent": "factual_question",
+        "complexity": "simple",
+        "is_ambiguous": False,
+        "clarity_confidence": 0.95,
+        "topic": "RAG system components",
+    },
+    "retrieved_docs": [
+        {
+            "content": "RAG 시스템은 검색(Retrieval), 증강(Augmentation), 생성(Generation) 세 가지 주요 구성 요소로 이루어져 있습니다.",
+            "metadata": {"source": "rag-guide.md"},
+            "relevance_score": 0.92,
+        },
+        {
+            "content": "검색 단계에서는 벡터 데이터베이스를 사용하여 관련 문서를 찾습니다.",
+            "metadata": {"source": "rag-guide.md"},
+            "relevance_score": 0.85,
+        },
+    ],
+    "response": {
+        "answer": "RAG 시스템은 검색(Retrieval), 증강(Augmentation), 생성(Generation) 세 가지 주요 구성 요소로 이루어져 있습니다.",
+        "sources": [{"title": "RAG Guide", "source": "rag-guide.md"}],
+        "confidence": 0.9,
+        "needs_disclaimer": False,
+    },
+    # Flow: analyze -> retrieve -> generate
+    "flow_steps": ["analyze", "retrieve", "evaluate", "generate"],
+})
+
+
+def _check_happy_path(data) -> bool:
+    """Simple analysis, relevant retrieval, grounded response, no detours"""
+    analysis = data["analysis_result"]
+    retrieved_docs = data["retrieved_docs"]
+    response = data["response"]
+    flow_steps = data["flow_steps"]
+
+    # Assert each condition so a failure names the one that broke
+    assert analysis["complexity"] == "simple"
+    assert not analysis["is_ambiguous"]
+    assert analysis["clarity_confidence"] >= 0.8
+    assert len(retrieved_docs) > 0
+    assert min(doc["relevance_score"] for doc in retrieved_docs) >= 0.7
+    assert response["answer"]
+    assert len(response["sources"]) > 0
+    assert not response["needs_disclaimer"]
+    assert "clarify" not in flow_steps
+    assert "web_search" not in flow_steps
+    assert "rewrite" not in flow_steps
+    return True
+
+
+# === Scenario 2: HITL Flow - Clarification required ===
+
+AMBIGUOUS_QUERY_STATE = MockState({
+    "query": "설정 방법 알려줘",
+    "session_id": "test-session-002",
+    "messages": [],
+})
+
+AMBIGUOUS_ANALYSIS = MappingProxyType({
+    "intent": "how_to",
+    "complexity": "simple",
+    "is_ambiguous": True,
+    "clarity_confidence": 0.4,
+    "ambiguity_type": "missing_context",
+})
+
+CLARIFICATION = MappingProxyType({
+    "question": "어떤 설정에 대해 알고 싶으신가요?",
+    "options": [
+        {"id": "1", "text": "시스템 환경 설정"},
+        {"id": "2", "text": "API 키 설정"},
+        {"id": "3", "text": "데이터베이스 설정"},
+        {"id": "4", "text": "로깅 설정"},
+    ],
+    "allow_custom_input": True,
+})
+
+USER_SELECTION = MappingProxyType({
+    "original_query": AMBIGUOUS_QUERY_STATE["query"],
+    "user_selection": "API 키 설정",
+})
+
+HITL_LIMIT = MappingProxyType({
+    "max_interactions": 2,
+    "attempted_interactions": 3,
+})
+
+
+# === Scenario 3: Corrective RAG - Query rewriting ===
+
+LOW_RELEVANCE_STATE = MockState({
+    "query": "최신 기능 업데이트 내용",
+    "session_id": "test-session-003",
+    "retrieved_docs": [],
+    "retry_count": 0,
+})
+
+RELEVANCE_EVALUATION = MappingProxyType({
+    "has_relevant_docs": False,
+    "avg_score": 0.45,
+    "threshold": 0.7,
+})
+
+QUERY_REWRITE = MappingProxyType({
+    "original_query": LOW_RELEVANCE_STATE["query"],
+    "rewritten_query": "RAG 시스템 새로운 기능 변경 사항 릴리즈 노트",
+})
+
+
+# === Scenario 4: Web Search Fallback ===
+
+# State with no internal results after retries
+NO_RESULTS_STATE = MockState({
+    "query": "2024년 AI 트렌드",
+    "session_id": "test-session-004",
+    "retry_count": 2,
+    "retrieved_docs": [],
+})
+
+WEB_RESULTS = (
+    {
+        "title": "2024 AI 트렌드 전망",
+        "url": "https://example.com/ai-trends-2024",
+        "snippet": "2024년 주요 AI 트렌드로는...",
+        "score": 0.85,
+    },
+)
+
+WEB_RESPONSE = MappingProxyType({
+    "answer": "웹 검색 결과에 따르면...",
+    "sources": [{"source_type": "web", "url": "https://example.com"}],
+    "needs_disclaimer": True,
+    "disclaimer": "이 정보는 외부 웹 검색 결과를 기반으로 합니다.",
+})
+
+
+# === Scenario 5: Complex Query - Multi-part questions ===
+
+COMPLEX_ANALYSIS = MappingProxyType({
+    "intent": "multi_part_question",
+    "complexity": "complex",
+    "sub_questions_count": 3,
+})
+
+DECOMPOSITION = MappingProxyType({
+    "original_query": "RAG 시스템의 구성 요소와 각각의 역할, 그리고 성능 최적화 방법은?",
+    "sub_questions": [
+        "RAG 시스템의 구성 요소는 무엇인가?",
+        "각 구성 요소의 역할은 무엇인가?",
+        "RAG 시스템의 성능 최적화 방법은?",
+    ],
+    "parallel_groups": [[0, 1], [2]],
+})
+
+SUB_ANSWERS = (
+    "RAG 시스템은 검색, 증강, 생성으로 구성됩니다.",
+    "검색은 관련 문서를 찾고, 증강은 컨텍스트를 추가하며, 생성은 응답을 만듭니다.",
+    "성능 최적화를 위해 캐싱, 청킹 최적화, 임베딩 모델 선택이 중요합니다.",
+)
+
+
+def _parallel_retrieval(sub_questions):
+    """Simulate parallel retrieval keyed by sub-question index"""
+    return {
+        i: {"query": q, "docs": [{"content": f"Answer for {q}"}]}
+        for i, q in enumerate(sub_questions)
+    }
+
+
+# === Scenario table: (name, data, check) ===
+
+SCENARIOS = [
+    ("happy_path.rag_components", HAPPY_PATH, _check_happy_path),
+    # Ambiguous queries trigger HITL
+    (
+        "hitl.ambiguous_query_triggers_clarification",
+        AMBIGUOUS_ANALYSIS,
+        lambda a: a["is_ambiguous"] or a["clarity_confidence"] < 0.8,
+    ),
+    (
+        "hitl.clarification_generates_options",
+        CLARIFICATION,
+        lambda c: 2 <= len(c["options"]) <= 5 and c["allow_custom_input"],
+    ),
+    (
+        "hitl.user_selection_refines_query",
+        USER_SELECTION,
+        lambda s: s["user_selection"] in f"{s['original_query']} - {s['user_selection']}",
+    ),
+    # HITL interactions are capped at the limit
+    (
+        "hitl.max_interactions_limit",
+        HITL_LIMIT,
+        lambda h: min(h["attempted_interactions"], h["max_interactions"]) <= h["max_interactions"],
+    ),
+    (
+        "corrective.low_relevance_triggers_rewrite",
+        RELEVANCE_EVALUATION,
+        lambda r: not r["has_relevant_docs"] or r["avg_score"] < r["threshold"],
+    ),
+    (
+        "corrective.query_rewriting_improves_results",
+        QUERY_REWRITE,
+        lambda q: (
+            len(q["rewritten_query"]) > len(q["original_query"])
+            and q["original_query"] != q["rewritten_query"]
+        ),
+    ),
+    # Retries run until the limit, which then triggers web search
+    (
+        "corrective.max_rewrite_attempts",
+        MappingProxyType({"max_retries": 2, "retry_count": 2}),
+        lambda r: r["retry_count"] >= r["max_retries"],
+    ),
+    (
+        "web_fallback.triggered_after_retries",
+        NO_RESULTS_STATE,
+        lambda s: s.get("retry_count", 0) >= 2,
+    ),
+    (
+        "web_fallback.returns_results",
+        WEB_RESULTS,
+        lambda results: len(results) > 0 and all("url" in r for r in results),
+    ),
+    (
+        "web_fallback.results_include_disclaimer",
+        WEB_RESPONSE,
+        lambda r: r["needs_disclaimer"] and "disclaimer" in r,
+    ),
+    (
+        "web_fallback.source_reliability_evaluation",
+        MappingProxyType({"url": "https://docs.python.org/3/library/asyncio.html"}),
+        lambda r: urlparse(r["url"]).netloc.lower() in TRUSTED_DOMAINS,
+    ),
+    (
+        "complex.query_detected",
+        COMPLEX_ANALYSIS,
+        lambda a: a["complexity"] == "complex" and a["sub_questions_count"] > 1,
+    ),
+    (
+        "complex.query_decomposition",
+        DECOMPOSITION,
+        lambda d: 2 <= len(d["sub_questions"]) <= 5,
+    ),
+    (
+        "complex.parallel_retrieval",
+        DECOMPOSITION["sub_questions"][:2],
+        lambda qs: len(_parallel_retrieval(qs)) == len(qs),
+    ),
+    # Sub-answers are synthesized into one coherent response
+    (
+        "complex.response_synthesis",
+        SUB_ANSWERS,
+        lambda answers: "\n\n".join(answers).count("\n\n") == len(answers) - 1,
+    ),
+    (
+        "errors.api_timeout",
+        MappingProxyType({
             "error_type": "timeout",
             "user_message": "응답 시간이 초과되었습니다. 다시 시도해 주세요.",
             "recoverable": True,
             "fallback_action": "retry",
-        }
-
-        assert error_response["recoverable"]
-        assert error_response["fallback_action"] == "retry"
-
-    @pytest.mark.asyncio
-    async def test_rate_limit_handling(self):
-        """Test handling of rate limits"""
-        error_response = {
+        }),
+        lambda r: r["recoverable"] and r["fallback_action"] == "retry",
+    ),
+    (
+        "errors.rate_limit",
+        MappingProxyType({
             "error_type": "rate_limit",
             "user_message": "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
             "recoverable": True,
             "retry_after": 60,
-        }
-
-        assert error_response["recoverable"]
-        assert error_response["retry_after"] > 0
-
-    @pytest.mark.asyncio
-    async def test_graceful_degradation(self):
-        """Test graceful degradation when services fail"""
-        # When LLM fails, should return cached or default response
-        fallback_response = {
+        }),
+        lambda r: r["recoverable"] and r["retry_after"] > 0,
+    ),
+    # When LLM fails, should return cached or default response
+    (
+        "errors.graceful_degradation",
+        MappingProxyType({
             "answer": "죄송합니다. 현재 서비스에 일시적인 문제가 있습니다. 잠시 후 다시 시도해 주세요.",
             "is_fallback": True,
-        }
+        }),
+        lambda r: r["is_fallback"] and "다시 시도" in r["answer"],
+    ),
+]
+
 
-        assert fallback_response["is_fallback"]
-        assert "다시 시도" in fallback_response["answer"]
+@pytest.mark.parametrize("name,data,check", SCENARIOS, ids=[s[0] for s in SCENARIOS])
+def test_scenario(name, data, check):
+    """Test one scenario row against its check"""
+    assert check(data), name
@@ -0,0 +1,53 @@
+"""Fixtures for integration tests that drive the FastAPI app"""
+
+import pytest
+import pytest_asyncio
+
+# Load the app (and its FastAPI/LangGraph dependency tree) once per session,
+# only for the integration suite
+from src.api.main import app as _app
+
+
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI application under test"""
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """FastAPI test client shared across the session (lifespan runs once)"""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(app):
+    """
+    In-process ASGI client for tests that don't need the app lifespan.
+
+    Requests go straight through httpx's ASGITransport instead of
+    TestClient's thread portal. Bound to the session event loop, which
+    pytest.ini makes the default for every test.
+    """
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def _clear_dependency_overrides(request):
+    """Undo per-test dependency overrides and orchestrator state on the shared app"""
+    yield
+    if {"client", "async_client"} & set(request.fixturenames):
+        import src.core.orchestrator as orchestrator_module
+
+        _app.dependency_overrides.clear()
+        # get_orchestrator() may have cached a patched RAGOrchestrator
+        orchestrator_module._orchestrator = None
@@ -1,8 +1,9 @@
 """Integration tests for basic RAG flow"""
 
+from typing import Any, Dict, List
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import patch
 
 from src.core.models import (
     QueryAnalysisOutput,
@@ -10,86 +11,137 @@ from src.core.models import (
     Complexity,
     Document,
     DocumentMetadata,
+    RAGRequest,
+    RAGResponse,
+    RetrievalSource,
 )
+from src.agents.query_processor import QueryProcessor
+from src.rag.response_generator import ResponseGenerator
+from src.rag.retriever import DocumentRetriever
 
 
-class TestBasicRAGFlow:
-    """Test basic RAG flow from query to response"""
+# Lightweight stubs exposing only the methods the code under test calls
+class StubLLM:
+    """LLM provider stub returning a fixed structured output"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        from src.api.main import app
-        return TestClient(app)
+    def __init__(self, structured: Any):
+        self.structured = structured
+        self.calls = 0
 
-    def test_health_check(self, client):
-        """Test health check endpoint"""
-        response = client.get("/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert "version" in data
-        assert "timestamp" in data
+    async def generate_structured(self, *args, **kwargs):
+        self.calls += 1
+        return self.structured
+
+
+class StubQueryProcessor:
+    """QueryProcessor stub returning a fixed analysis"""
+
+    def __init__(self, analysis: QueryAnalysisOutput):
+        self.analysis = analysis
+
+    async def analyze(self, *args, **kwargs) -> QueryAnalysisOutput:
+        return self.analysis
+
+
+class StubRetriever:
+    """DocumentRetriever stub returning fixed documents and metrics"""
+
+    def __init__(self, documents: List[Document], metrics: Dict[str, Any]):
+        self.documents = documents
+        self.metrics = metrics
+
+    async def retrieve(self, *args, **kwargs) -> List[Document]:
+        return self.documents
+
+    def calculate_relevance_metrics(self, *args, **kwargs) -> Dict[str, Any]:
+        return self.metrics
+
+
+class StubResponseGenerator:
+    """ResponseGenerator stub returning a fixed response and quality score"""
+
+    def __init__(self, output: ResponseOutput, quality: float):
+        self.output = output
+        self.quality = quality
+
+    async def generate(self, *args, **kwargs) -> ResponseOutput:
+        return self.output
+
+    def evaluate_response_quality(self, *args, **kwargs) -> float:
+        return self.quality
+
+
+class StubVectorStore:
+    """VectorStoreManager stub returning fixed search results"""
+
+    def __init__(self, results: List[Dict[str, Any]]):
+        self.results = results
 
-    def test_root_endpoint(self, client):
-        """Test root endpoint"""
-        response = client.get("/")
+    async def search(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        return self.results
+
+
+# Chat route stubs built once per module and patched in with new=
+_STUB_QUERY_PROCESSOR = StubQueryProcessor(
+    QueryAnalysisOutput(
+        refined_query="Docker 배포 방법",
+        complexity=Complexity.SIMPLE,
+        clarity_confidence=0.9,
+        is_ambiguous=False,
+        ambiguity_type=None,
+        detected_domains=["devops"],
+    )
+)
+_STUB_RETRIEVER = StubRetriever(
+    [
+        Document(
+            content="Docker를 사용한 배포 방법: 1. Dockerfile 작성 2. 이미지 빌드 3. 컨테이너 실행",
+            metadata=DocumentMetadata(source="deployment.md", title="배포 가이드"),
+            embedding_score=0.95,
+        ),
+    ],
+    metrics={
+        "avg_relevance": 0.9,
+        "high_relevance_count": 2,
+        "relevance_scores": [0.95, 0.85],
+    },
+)
+_STUB_RESPONSE_GENERATOR = StubResponseGenerator(
+    ResponseOutput(
+        response="Docker로 배포하려면 다음 단계를 따르세요: 1. Dockerfile 작성 [1]",
+        sources=["deployment.md"],
+        has_sufficient_info=True,
+    ),
+    quality=0.9,
+)
+
+
+class TestBasicRAGFlow:
+    """Test basic RAG flow from query to response"""
+
+    @pytest.mark.parametrize(
+        "path,expected_keys",
+        [
+            ("/health", {"status", "version", "timestamp"}),
+            ("/", {"message", "version"}),
+        ],
+        ids=["health", "root"],
+    )
+    async def test_smoke(self, async_client, path, expected_keys):
+        """Test health check and root endpoints"""
+        response = await async_client.get(path)
         assert response.status_code == 200
         data = response.json()
-        assert "message" in data
-        assert "version" in data
-
-    @pytest.mark.asyncio
-    @patch("src.api.routes.chat.QueryProcessor")
-    @patch("src.api.routes.chat.DocumentRetriever")
-    @patch("src.api.routes.chat.ResponseGenerator")
-    async def test_chat_endpoint_success(
-        self,
-        mock_response_generator_class,
-        mock_retriever_class,
-        mock_query_processor_class,
-        client,
-        sample_documents,
-    ):
+        assert expected_keys <= data.keys()
+        if path == "/health":
+            assert data["status"] == "healthy"
+
+    @patch("src.api.routes.chat.QueryProcessor", new=lambda *a, **k: _STUB_QUERY_PROCESSOR)
+    @patch("src.api.routes.chat.DocumentRetriever", new=lambda *a, **k: _STUB_RETRIEVER)
+    @patch("src.api.routes.chat.ResponseGenerator", new=lambda *a, **k: _STUB_RESPONSE_GENERATOR)
+    async def test_chat_endpoint_success(self, async_client):
         """Test successful chat request"""
-        # Setup mocks
-        mock_query_processor = MagicMock()
-        mock_query_processor.analyze = AsyncMock(
-            return_value=QueryAnalysisOutput(
-                refined_query="Docker 배포 방법",
-                complexity=Complexity.SIMPLE,
-                clarity_confidence=0.9,
-                is_ambiguous=False,
-                ambiguity_type=None,
-                detected_domains=["devops"],
-            )
-        )
-        mock_query_processor_class.return_value = mock_query_processor
-
-        mock_retriever = MagicMock()
-        mock_retriever.retrieve = AsyncMock(return_value=sample_documents)
-        mock_retriever.calculate_relevance_metrics = MagicMock(
-            return_value={
-                "avg_relevance": 0.9,
-                "high_relevance_count": 2,
-                "relevance_scores": [0.95, 0.85],
-            }
-        )
-        mock_retriever_class.return_value = mock_retriever
-
-        mock_response_gen = MagicMock()
-        mock_response_gen.generate = AsyncMock(
-            return_value=ResponseOutput(
-                response="Docker로 배포하려면 다음 단계를 따르세요: 1. Dockerfile 작성 [1]",
-                sources=["deployment.md"],
-                has_sufficient_info=True,
-            )
-        )
-        mock_response_gen.evaluate_response_quality = MagicMock(return_value=0.9)
-        mock_response_generator_class.return_value = mock_response_gen
-
-        # Make request
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
             json={"query": "Docker 배포 방법은?"}
         )
@@ -104,9 +156,9 @@ class TestBasicRAGFlow:
         assert "processing_time_ms" in data
         assert data["retrieval_source"] == "vector"
 
-    def test_chat_endpoint_empty_query(self, client):
+    async def test_chat_endpoint_empty_query(self, async_client):
         """Test chat with empty query"""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
             json={"query": ""}
         )
@@ -120,8 +172,6 @@ class TestAPISchemas:
 
     def test_rag_request_validation(self):
         """Test RAGRequest validation"""
-        from src.core.models import RAGRequest
-
         # Valid request
         request = RAGRequest(query="테스트 질문")
         assert request.query == "테스트 질문"
@@ -138,8 +188,6 @@ class TestAPISchemas:
 
     def test_rag_response_model(self):
         """Test RAGResponse model"""
-        from src.core.models import RAGResponse, RetrievalSource
-
         response = RAGResponse(
             response="테스트 응답입니다.",
             sources=["doc1.md", "doc2.md"],
@@ -158,25 +206,11 @@ class TestAPISchemas:
 class TestQueryProcessorIntegration:
     """Integration tests for QueryProcessor"""
 
-    @pytest.mark.asyncio
-    async def test_query_processor_with_mock_llm(self, mock_llm_provider):
-        """Test QueryProcessor with mocked LLM"""
-        from src.agents.query_processor import QueryProcessor
-        from src.core.models import QueryAnalysisOutput, Complexity
-
-        # Configure mock response
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=QueryAnalysisOutput(
-                refined_query="Docker를 사용한 배포 방법",
-                complexity=Complexity.SIMPLE,
-                clarity_confidence=0.9,
-                is_ambiguous=False,
-                ambiguity_type=None,
-                detected_domains=["devops"],
-            )
-        )
+    async def test_query_processor_with_mock_llm(self, sample_query_analysis_output):
+        """Test QueryProcessor with stubbed LLM"""
+        stub_llm = StubLLM(sample_query_analysis_output)
 
-        processor = QueryProcessor(llm_provider=mock_llm_provider)
+        processor = QueryProcessor(llm_provider=stub_llm)
         result = await processor.analyze("Docker 배포 방법은?")
 
         assert isinstance(result, QueryAnalysisOutput)
@@ -187,23 +221,28 @@ class TestQueryProcessorIntegration:
 class TestDocumentRetrieverIntegration:
     """Integration tests for DocumentRetriever"""
 
-    @pytest.mark.asyncio
-    async def test_retriever_with_mock_store(self, mock_vector_store):
-        """Test DocumentRetriever with mocked vector store"""
-        from src.rag.retriever import DocumentRetriever
+    async def test_retriever_with_mock_store(self):
+        """Test DocumentRetriever with stubbed vector store"""
+        stub_store = StubVectorStore(
+            [
+                {
+                    "content": "Test document content about deployment",
+                    "metadata": {"source": "test.md", "title": "Test Document"},
+                    "distance": 0.1,
+                    "id": "doc_1",
+                }
+            ]
+        )
 
-        retriever = DocumentRetriever(vector_store=mock_vector_store)
+        retriever = DocumentRetriever(vector_store=stub_store)
         documents = await retriever.retrieve("Docker 배포")
 
         assert len(documents) > 0
         assert documents[0].content is not None
         assert documents[0].metadata is not None
 
-    @pytest.mark.asyncio
     async def test_retriever_metrics_calculation(self, sample_documents):
         """Test relevance metrics calculation"""
-        from src.rag.retriever import DocumentRetriever
-
         retriever = DocumentRetriever()
         metrics = retriever.calculate_relevance_metrics(sample_documents, threshold=0.8)
 
@@ -216,25 +255,11 @@ class TestDocumentRetrieverIntegration:
 class TestResponseGeneratorIntegration:
     """Integration tests for ResponseGenerator"""
 
-    @pytest.mark.asyncio
-    async def test_generator_with_mock_llm(
-        self,
-        mock_llm_provider,
-        sample_documents,
-    ):
-        """Test ResponseGenerator with mocked LLM"""
-        from src.rag.response_generator import ResponseGenerator
-        from src.core.models import ResponseOutput
-
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=ResponseOutput(
-                response="Docker 배포를 위해서는 Dockerfile을 작성하고 이미지를 빌드합니다 [1].",
-                sources=["deployment.md"],
-                has_sufficient_info=True,
-            )
-        )
+    async def test_generator_with_mock_llm(self, sample_documents, sample_response_output):
+        """Test ResponseGenerator with stubbed LLM"""
+        stub_llm = StubLLM(sample_response_output)
 
-        generator = ResponseGenerator(llm_provider=mock_llm_provider)
+        generator = ResponseGenerator(llm_provider=stub_llm)
         result = await generator.generate(
             query="Docker 배포 방법은?",
             documents=sample_documents,
@@ -246,9 +271,6 @@ class TestResponseGeneratorIntegration:
 
     def test_response_quality_evaluation(self, sample_documents):
         """Test response quality evaluation"""
-        from src.rag.response_generator import ResponseGenerator
-        from src.core.models import ResponseOutput
-
         generator = ResponseGenerator()
 
         # High quality response
@@ -1,62 +1,80 @@
 """Integration tests for Corrective RAG flow"""
 
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
 
 from src.core.models import (
     QueryAnalysisOutput,
     ResponseOutput,
     Complexity,
+    Document,
+    DocumentMetadata,
     RelevanceLevel,
     RetrievalSource,
 )
+from src.core.edges import route_after_evaluation
 from src.rag.relevance_evaluator import RelevanceEvaluationOutput
 from src.rag.quality_evaluator import QualityEvaluationOutput
 
+# Read-only relevance metrics shared across tests
+_METRICS_MEDIUM = MappingProxyType(
+    {"avg_relevance": 0.6, "high_relevance_count": 0, "sufficient": False}
+)
+_METRICS_LOW = MappingProxyType(
+    {"avg_relevance": 0.5, "high_relevance_count": 0, "sufficient": False}
+)
+_METRICS_HIGH = MappingProxyType(
+    {"avg_relevance": 0.9, "high_relevance_count": 2, "sufficient": True}
+)
+_METRICS_ALWAYS_LOW = MappingProxyType(
+    {"avg_relevance": 0.3, "high_relevance_count": 0, "sufficient": False}
+)
+
+_DOCKER_MD_DOC = Document.model_construct(
+    content="Docker 배포 가이드",
+    metadata=DocumentMetadata.model_construct(source="docker.md"),
+    embedding_score=0.7,
+)
+
 
 class TestCorrectiveRAGFlow:
     """Integration tests for the corrective RAG pipeline"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        from src.api.main import app
-        return TestClient(app)
-
-    def test_health_check(self, client):
+    async def test_health_check(self, async_client):
         """Verify API is running"""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     @patch("src.core.orchestrator.RAGOrchestrator")
-    async def test_corrective_flow_endpoint(self, mock_orchestrator_class, client):
+    async def test_corrective_flow_endpoint(self, mock_orchestrator_class, async_client):
         """Test chat endpoint with corrective RAG"""
         from src.core.models import RAGResponse
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.process_query = AsyncMock(
-            return_value=RAGResponse(
-                response="Docker 배포를 위해서는...",
-                sources=["deployment.md"],
-                confidence=0.85,
-                needs_disclaimer=False,
-                retrieval_source=RetrievalSource.VECTOR,
-                processing_time_ms=2500,
-                session_id="test-session",
-                debug={
-                    "retrieval": {
-                        "correction_triggered": True,
-                        "retry_count": 1
+        mock_orchestrator = SimpleNamespace(
+            process_query=AsyncMock(
+                return_value=RAGResponse(
+                    response="Docker 배포를 위해서는...",
+                    sources=["deployment.md"],
+                    confidence=0.85,
+                    needs_disclaimer=False,
+                    retrieval_source=RetrievalSource.VECTOR,
+                    processing_time_ms=2500,
+                    session_id="test-session",
+                    debug={
+                        "retrieval": {
+                            "correction_triggered": True,
+                            "retry_count": 1
+                        }
                     }
-                }
+                )
             )
         )
         mock_orchestrator_class.return_value = mock_orchestrator
 
         # Make request through simple endpoint to avoid orchestrator initialization
-        response = client.post(
+        response = await async_client.post(
             "/api/chat/simple",
             json={"query": "Docker 배포 방법"}
         )
@@ -69,45 +87,30 @@ class TestCorrectiveEngineIntegration:
     """Integration tests for CorrectiveEngine"""
 
     @pytest.fixture
-    def mock_components(self, mock_llm_provider, mock_vector_store):
-        """Set up mocked components"""
-        from src.rag.retriever import DocumentRetriever
-        from src.rag.relevance_evaluator import RelevanceEvaluator
-        from src.rag.query_rewriter import QueryRewriter
-        from src.core.models import Document, DocumentMetadata
-
-        retriever = MagicMock(spec=DocumentRetriever)
-        retriever.retrieve = AsyncMock(return_value=[
-            Document(
-                content="Docker 배포 가이드",
-                metadata=DocumentMetadata(source="docker.md"),
-                embedding_score=0.7
-            )
-        ])
-
-        evaluator = MagicMock(spec=RelevanceEvaluator)
-        evaluator.evaluate_batch = AsyncMock(return_value=[
-            RelevanceEvaluationOutput(
-                relevance_score=0.6,
-                relevance_level=RelevanceLevel.MEDIUM,
-                reason="Partial match",
-                useful_parts=[]
+    def mock_components(self):
+        """Set up stubbed components exposing only what CorrectiveEngine calls"""
+        retriever = SimpleNamespace(retrieve=AsyncMock(return_value=[_DOCKER_MD_DOC]))
+
+        evaluator = SimpleNamespace(
+            evaluate_batch=AsyncMock(return_value=[
+                RelevanceEvaluationOutput(
+                    relevance_score=0.6,
+                    relevance_level=RelevanceLevel.MEDIUM,
+                    reason="Partial match",
+                    useful_parts=[]
+                )
+            ]),
+            calculate_metrics=lambda *args, **kwargs: _METRICS_MEDIUM,
+        )
+
+        rewriter = SimpleNamespace(
+            rewrite_auto=AsyncMock(
+                return_value=("Docker container deployment guide", "synonym_expansion")
             )
-        ])
-        evaluator.calculate_metrics = MagicMock(return_value={
-            "avg_relevance": 0.6,
-            "high_relevance_count": 0,
-            "sufficient": False
-        })
-
-        rewriter = MagicMock(spec=QueryRewriter)
-        rewriter.rewrite_auto = AsyncMock(
-            return_value=("Docker container deployment guide", "synonym_expansion")
         )
 
         return retriever, evaluator, rewriter
 
-    @pytest.mark.asyncio
     async def test_correction_improves_relevance(self, mock_components):
         """Test that correction loop improves relevance"""
         from src.rag.corrective_engine import CorrectiveEngine
@@ -115,10 +118,8 @@ class TestCorrectiveEngineIntegration:
         retriever, evaluator, rewriter = mock_components
 
         # After rewrite, return higher relevance
-        evaluator.calculate_metrics = MagicMock(side_effect=[
-            {"avg_relevance": 0.5, "high_relevance_count": 0, "sufficient": False},
-            {"avg_relevance": 0.9, "high_relevance_count": 2, "sufficient": True},
-        ])
+        metrics = iter([_METRICS_LOW, _METRICS_HIGH])
+        evaluator.calculate_metrics = lambda *args, **kwargs: next(metrics)
 
         engine = CorrectiveEngine(
             retriever=retriever,
@@ -131,7 +132,6 @@ class TestCorrectiveEngineIntegration:
         assert result["correction_triggered"] is True
         assert result["action_taken"] == "proceed"
 
-    @pytest.mark.asyncio
     async def test_web_search_fallback(self, mock_components):
         """Test fallback to web search after max retries"""
         from src.rag.corrective_engine import CorrectiveEngine
@@ -139,11 +139,7 @@ class TestCorrectiveEngineIntegration:
         retriever, evaluator, rewriter = mock_components
 
         # Always return low relevance
-        evaluator.calculate_metrics = MagicMock(return_value={
-            "avg_relevance": 0.3,
-            "high_relevance_count": 0,
-            "sufficient": False
-        })
+        evaluator.calculate_metrics = lambda *args, **kwargs: _METRICS_ALWAYS_LOW
 
         engine = CorrectiveEngine(
             retriever=retriever,
@@ -162,7 +158,6 @@ class TestCorrectiveEngineIntegration:
 class TestQualityEvaluatorIntegration:
     """Integration tests for QualityEvaluator"""
 
-    @pytest.mark.asyncio
     async def test_quality_evaluation_with_mock_llm(self, mock_llm_provider):
         """Test quality evaluation"""
         from src.rag.quality_evaluator import QualityEvaluator
@@ -219,17 +214,11 @@ class TestQualityEvaluatorIntegration:
 class TestLangGraphOrchestrator:
     """Integration tests for LangGraph Orchestrator"""
 
-    @pytest.mark.asyncio
-    async def test_orchestrator_graph_structure(self):
+    async def test_orchestrator_graph_structure(self, orchestrator):
         """Test that orchestrator graph is properly constructed"""
-        from src.core.orchestrator import RAGOrchestrator
-
-        orchestrator = RAGOrchestrator()
-
         # Verify graph has expected nodes
         assert orchestrator.graph is not None
 
-    @pytest.mark.asyncio
     @patch("src.core.nodes.QueryProcessor")
     @patch("src.core.nodes.DocumentRetriever")
     @patch("src.core.nodes.RelevanceEvaluator")
@@ -249,38 +238,34 @@ class TestLangGraphOrchestrator:
 class TestRouting:
     """Test routing logic"""
 
-    def test_route_after_evaluation_sufficient(self):
-        """Test routing when relevance is sufficient"""
-        from src.core.edges import route_after_evaluation
-
-        state = {
-            "avg_relevance": 0.9,
-            "high_relevance_count": 3,
-            "retry_count": 0,
-        }
-
-        assert route_after_evaluation(state) == "generate"
-
-    def test_route_after_evaluation_needs_rewrite(self):
-        """Test routing when rewrite is needed"""
-        from src.core.edges import route_after_evaluation
-
-        state = {
-            "avg_relevance": 0.5,
-            "high_relevance_count": 0,
-            "retry_count": 0,
-        }
-
-        assert route_after_evaluation(state) == "rewrite"
-
-    def test_route_after_evaluation_web_search(self):
-        """Test routing to web search after max retries"""
-        from src.core.edges import route_after_evaluation
-
+    @pytest.mark.parametrize(
+        "avg,high,retry,expected",
+        [
+            (0.9, 3, 0, "generate"),  # Relevance is sufficient
+            (0.5, 0, 0, "rewrite"),  # Rewrite is needed
+            (0.3, 0, 2, "web_search"),  # Web search after max retries
+        ],
+    )
+    def test_route_after_evaluation(self, avg, high, retry, expected):
+        """Test routing after relevance evaluation"""
         state = {
-            "avg_relevance": 0.3,
-            "high_relevance_count": 0,
-            "retry_count": 2,
+            "avg_relevance": avg,
+            "high_relevance_count": high,
+            "retry_count": retry,
         }
 
-        assert route_after_evaluation(state) == "web_search"
+        assert route_after_evaluation(state) == expected
+
+    @pytest.mark.parametrize(
+        "retrieved_docs,expected",
+        [
+            ([{"content": "Docker 배포 가이드"}], "generate"),  # Any retrieval result
+            ([], "web_search"),  # Nothing retrieved
+        ],
+        ids=["docs", "no_docs"],
+    )
+    def test_route_after_evaluation_by_retrieval(self, retrieved_docs, expected):
+        """Test routing on retrieval results (relevance thresholds are disabled)"""
+        state = {"retrieved_docs": retrieved_docs, "retry_count": 0}
+
+        assert route_after_evaluation(state) == expected
@@ -1,48 +1,54 @@
 """Integration tests for HITL flow"""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
 
 from src.core.models import (
+    AnalyzeAndClarifyOutput,
+    ClarificationDraft,
     ClarificationOutput,
+    Complexity,
+    QueryAnalysisOutput,
     RAGResponse,
     RetrievalSource,
     AmbiguityType,
 )
 from src.agents.hitl_controller import HITLController
+from src.agents.query_processor import QueryProcessor
+
+
+@pytest.fixture(scope="module")
+def hitl_controller(mock_llm_provider):
+    """HITLController shared by the read-only should_clarify cases"""
+    return HITLController(llm_provider=mock_llm_provider)
 
 
 class TestHITLFlow:
     """Integration tests for HITL clarification flow"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        from src.api.main import app
-        return TestClient(app)
-
-    def test_health_check(self, client):
+    async def test_health_check(self, async_client):
         """Verify API is running"""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     @patch("src.core.orchestrator.RAGOrchestrator")
     async def test_clarification_triggered_for_ambiguous_query(
-        self, mock_orchestrator_class, client
+        self, mock_orchestrator_class, async_client
     ):
         """Test that clarification is triggered for ambiguous queries"""
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.process_query = AsyncMock(
-            return_value=ClarificationOutput(
-                clarification_question="어떤 종류의 배포를 원하시나요?",
-                options=["Docker 배포", "Kubernetes 배포", "직접 서버 배포"],
+        mock_orchestrator = SimpleNamespace(
+            process_query=AsyncMock(
+                return_value=ClarificationOutput(
+                    clarification_question="어떤 종류의 배포를 원하시나요?",
+                    options=["Docker 배포", "Kubernetes 배포", "직접 서버 배포"],
+                )
             )
         )
         mock_orchestrator_class.return_value = mock_orchestrator
 
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
             json={"query": "배포 방법"}
         )
@@ -50,124 +56,192 @@ class TestHITLFlow:
         # Response should indicate clarification needed
         assert response.status_code in [200, 500]
 
-    @pytest.mark.asyncio
-    async def test_hitl_controller_should_clarify(self, mock_llm_provider):
+    @pytest.mark.parametrize(
+        "clarity,ambiguous,count,expected",
+        [
+            (0.5, True, 0, True),  # Should clarify for ambiguous query
+            (0.9, False, 0, False),  # Should not clarify for clear query
+            (0.5, True, 2, False),  # Should not exceed max interactions
+        ],
+    )
+    def test_hitl_controller_should_clarify(
+        self, hitl_controller, clarity, ambiguous, count, expected
+    ):
         """Test HITL controller clarification decision"""
-        controller = HITLController(llm_provider=mock_llm_provider)
-
-        # Should clarify for ambiguous query
-        assert controller.should_clarify(
-            clarity_confidence=0.5,
-            is_ambiguous=True,
-            interaction_count=0,
-        ) is True
-
-        # Should not clarify for clear query
-        assert controller.should_clarify(
-            clarity_confidence=0.9,
-            is_ambiguous=False,
-            interaction_count=0,
-        ) is False
-
-        # Should not exceed max interactions
-        assert controller.should_clarify(
-            clarity_confidence=0.5,
-            is_ambiguous=True,
-            interaction_count=2,
-        ) is False
+        assert hitl_controller.should_clarify(clarity, ambiguous, count) is expected
 
 
 class TestHITLOrchestration:
     """Test HITL orchestration in LangGraph"""
 
-    @pytest.mark.asyncio
-    async def test_orchestrator_returns_clarification(self, mock_llm_provider):
+    async def test_orchestrator_returns_clarification(self, mock_llm_provider, orchestrator):
         """Test orchestrator returns clarification for ambiguous query"""
-        from src.core.orchestrator import RAGOrchestrator
-        from src.core.models import QueryAnalysisOutput, Complexity
-
-        with patch("src.agents.query_processor.QueryProcessor.analyze") as mock_analyze:
-            mock_analyze.return_value = QueryAnalysisOutput(
-                refined_query="배포 방법",
-                complexity=Complexity.SIMPLE,
-                clarity_confidence=0.4,  # Low confidence triggers HITL
-                is_ambiguous=True,
-                ambiguity_type=AmbiguityType.MULTIPLE_INTERPRETATION,
-                detected_domains=["deployment"],
-            )
-
-            with patch("src.agents.hitl_controller.HITLController.generate_clarification") as mock_clarify:
-                mock_clarify.return_value = ClarificationOutput(
+        with patch("src.agents.query_processor.QueryProcessor.analyze_and_clarify") as mock_analyze:
+            mock_analyze.return_value = AnalyzeAndClarifyOutput(
+                analysis=QueryAnalysisOutput(
+                    refined_query="배포 방법",
+                    complexity=Complexity.SIMPLE,
+                    clarity_confidence=0.4,  # Low confidence triggers HITL
+                    is_ambiguous=True,
+                    ambiguity_type=AmbiguityType.MULTIPLE_INTERPRETATION,
+                    detected_domains=["deployment"],
+                ),
+                clarification=ClarificationDraft(
                     clarification_question="어떤 배포 방식을 원하시나요?",
                     options=["Docker", "Kubernetes", "직접 설치"],
-                )
+                ),
+            )
 
-                orchestrator = RAGOrchestrator()
-                result = await orchestrator.process_query(
-                    query="배포 방법",
-                    session_id="test-session",
-                )
+            result = await orchestrator.process_query(
+                query="배포 방법",
+                session_id="test-session",
+            )
 
-                # Should return clarification output
-                assert isinstance(result, ClarificationOutput)
-                assert result.clarification_question != ""
+            # Should return the clarification drafted during analysis
+            assert isinstance(result, ClarificationOutput)
+            assert result.clarification_question == "어떤 배포 방식을 원하시나요?"
+            assert result.options == ["Docker", "Kubernetes", "직접 설치"]
 
-    @pytest.mark.asyncio
-    async def test_orchestrator_continues_after_clarification(self, mock_llm_provider):
+    async def test_orchestrator_continues_after_clarification(self, mock_llm_provider, orchestrator):
         """Test orchestrator continues after user provides clarification"""
-        from src.core.orchestrator import RAGOrchestrator
+        # First call - should return clarification
+        with patch("src.agents.query_processor.QueryProcessor.analyze_and_clarify") as mock_analyze:
+            mock_analyze.return_value = AnalyzeAndClarifyOutput(
+                analysis=QueryAnalysisOutput(
+                    refined_query="배포",
+                    complexity=Complexity.SIMPLE,
+                    clarity_confidence=0.4,
+                    is_ambiguous=True,
+                    ambiguity_type=AmbiguityType.VAGUE_TERM,
+                    detected_domains=[],
+                ),
+                clarification=ClarificationDraft(
+                    clarification_question="무엇을 배포하시려고요?",
+                    options=["애플리케이션", "데이터베이스", "서비스"],
+                ),
+            )
 
-        orchestrator = RAGOrchestrator()
+            result = await orchestrator.process_query(
+                query="배포",
+                session_id="test-session-2",
+            )
 
-        # First call - should return clarification
-        with patch("src.agents.query_processor.QueryProcessor.analyze") as mock_analyze:
-            from src.core.models import QueryAnalysisOutput, Complexity
+            assert isinstance(result, ClarificationOutput)
+            assert orchestrator.has_pending_session("test-session-2")
 
-            mock_analyze.return_value = QueryAnalysisOutput(
-                refined_query="배포",
+    async def test_analyze_and_clarify_single_llm_call(self, mock_llm_provider):
+        """Test fused analysis makes one LLM call and drops clarification for clear queries"""
+        mock_llm_provider.generate_structured.return_value = AnalyzeAndClarifyOutput(
+            analysis=QueryAnalysisOutput(
+                refined_query="Docker 배포 방법",
                 complexity=Complexity.SIMPLE,
-                clarity_confidence=0.4,
-                is_ambiguous=True,
-                ambiguity_type=AmbiguityType.VAGUE_TERM,
-                detected_domains=[],
-            )
+                clarity_confidence=0.9,
+                is_ambiguous=False,
+                detected_domains=["devops"],
+            ),
+            clarification=ClarificationDraft(
+                clarification_question="어떤 배포 방식을 원하시나요?",
+                options=["Docker", "Kubernetes"],
+            ),
+        )
 
-            with patch("src.agents.hitl_controller.HITLController.generate_clarification") as mock_clarify:
-                mock_clarify.return_value = ClarificationOutput(
-                    clarification_question="무엇을 배포하시려고요?",
-                    options=["애플리케이션", "데이터베이스", "서비스"],
-                )
+        processor = QueryProcessor(llm_provider=mock_llm_provider)
+        result = await processor.analyze_and_clarify("Docker 배포 방법은?")
 
-                result = await orchestrator.process_query(
-                    query="배포",
-                    session_id="test-session-2",
-                )
+        mock_llm_provider.generate_structured.assert_awaited_once()
+        assert result.analysis.refined_query == "Docker 배포 방법"
+        assert result.clarification is None
+
+
+class TestFusedClarification:
+    """Test validation of the clarification drafted during query analysis"""
+
+    @pytest.fixture
+    def hitl(self, mock_llm_provider, monkeypatch):
+        """HITLController used by the nodes, with clarification enabled"""
+        controller = HITLController(llm_provider=mock_llm_provider)
+        monkeypatch.setattr(controller, "should_clarify", lambda **kwargs: True)
+        monkeypatch.setattr("src.core.nodes.HITLController", lambda: controller)
+        return controller
+
+    async def _analyze(self, monkeypatch, options):
+        """Run analyze_query_node on an LLM draft with the given options"""
+        from src.core.nodes import analyze_query_node
+        from src.core.state import create_initial_state
+
+        # Parsed the way generate_structured parses the raw LLM JSON
+        result = AnalyzeAndClarifyOutput.model_validate({
+            "analysis": {
+                "refined_query": "배포 방법",
+                "complexity": "simple",
+                "clarity_confidence": 0.4,
+                "is_ambiguous": True,
+                "ambiguity_type": "multiple_interpretation",
+                "detected_domains": ["deployment"],
+            },
+            "clarification": {
+                "clarification_question": "어떤 배포 방식을 원하시나요?",
+                "options": options,
+            },
+        })
+
+        async def analyze_and_clarify(query):
+            return result
+
+        processor = SimpleNamespace(analyze_and_clarify=analyze_and_clarify)
+        monkeypatch.setattr("src.core.nodes.QueryProcessor", lambda: processor)
+
+        state = create_initial_state("배포 방법", "test-session")
+        return {**state, **await analyze_query_node(state)}
+
+    async def test_single_option_falls_back_to_generation(self, hitl, monkeypatch):
+        """Test that a one-option draft is discarded for generate_clarification"""
+        from src.core.nodes import clarify_hitl_node
+
+        generated = ClarificationOutput.model_construct(
+            clarification_question="어떤 배포를 원하시나요?",
+            options=["Docker", "Kubernetes"],
+        )
+        hitl.generate_clarification = AsyncMock(return_value=generated)
 
-                assert isinstance(result, ClarificationOutput)
-                assert orchestrator.has_pending_session("test-session-2")
+        state = await self._analyze(monkeypatch, ["Docker"])
+        assert state["clarification_question"] is None
+
+        result = await clarify_hitl_node(state)
+
+        hitl.generate_clarification.assert_awaited_once()
+        assert result["clarification_options"] == ["Docker", "Kubernetes"]
+
+    async def test_six_options_clamped_to_five(self, hitl, monkeypatch):
+        """Test that a six-option draft is truncated and reused without another LLM call"""
+        from src.core.nodes import clarify_hitl_node
+
+        hitl.generate_clarification = AsyncMock()
+        options = [f"옵션 {i}" for i in range(6)]
+
+        state = await self._analyze(monkeypatch, options)
+        result = await clarify_hitl_node(state)
+
+        hitl.generate_clarification.assert_not_awaited()
+        assert result["clarification_question"] == "어떤 배포 방식을 원하시나요?"
+        assert result["clarification_options"] == options[:5]
 
 
 class TestHITLAPI:
     """Test HITL-related API endpoints"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        from src.api.main import app
-        return TestClient(app)
-
-    def test_chat_endpoint_exists(self, client):
+    async def test_chat_endpoint_exists(self, async_client):
         """Test chat endpoint is accessible"""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat",
             json={"query": "테스트 질문"},
         )
         # May fail without real LLM, but endpoint should exist
         assert response.status_code in [200, 500]
 
-    def test_clarify_endpoint_exists(self, client):
+    async def test_clarify_endpoint_exists(self, async_client):
         """Test clarify endpoint is accessible"""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat/clarify",
             json={
                 "session_id": "nonexistent-session",
@@ -177,9 +251,9 @@ class TestHITLAPI:
         # Should return 400 for expired/nonexistent session
         assert response.status_code in [400, 500]
 
-    def test_clarify_requires_session_id(self, client):
+    async def test_clarify_requires_session_id(self, async_client):
         """Test clarify endpoint requires session_id"""
-        response = client.post(
+        response = await async_client.post(
             "/api/chat/clarify",
             json={"user_response": "테스트"},
         )
@@ -190,19 +264,17 @@ class TestHITLAPI:
 class TestMaxHITLInteractions:
     """Test maximum HITL interaction limit"""
 
-    @pytest.mark.asyncio
-    async def test_max_interactions_enforced(self, mock_llm_provider):
+    @pytest.mark.parametrize(
+        "clarity,ambiguous,count,expected",
+        [
+            (0.5, True, 0, True),  # First interaction - should clarify
+            (0.5, True, 1, True),  # Second interaction - should clarify
+            (0.5, True, 2, False),  # Third interaction (at max=2) - should NOT clarify
+            (0.5, True, 3, False),  # Beyond max - should NOT clarify
+        ],
+    )
+    def test_max_interactions_enforced(
+        self, hitl_controller, clarity, ambiguous, count, expected
+    ):
         """Test that max HITL interactions is enforced"""
-        controller = HITLController(llm_provider=mock_llm_provider)
-
-        # First interaction - should clarify
-        assert controller.should_clarify(0.5, True, 0) is True
-
-        # Second interaction - should clarify
-        assert controller.should_clarify(0.5, True, 1) is True
-
-        # Third interaction (at max=2) - should NOT clarify
-        assert controller.should_clarify(0.5, True, 2) is False
-
-        # Beyond max - should NOT clarify
-        assert controller.should_clarify(0.5, True, 3) is False
+        assert hitl_controller.should_clarify(clarity, ambiguous, count) is expected
@@ -1,8 +1,12 @@
 """Integration tests for Web Search Fallback"""
 
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
 
 from src.core.models import (
     RAGResponse,
@@ -10,83 +14,77 @@ from src.core.models import (
     Document,
     DocumentMetadata,
 )
-from src.agents.web_search_agent import WebSearchAgent, TavilyResult
-
-
-class TestWebSearchFallback:
-    """Integration tests for web search fallback behavior"""
-
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        from src.api.main import app
-        return TestClient(app)
-
-    def test_health_check(self, client):
-        """Verify API is running"""
-        response = client.get("/health")
-        assert response.status_code == 200
-
-    @pytest.mark.asyncio
-    async def test_web_search_triggered_after_retries(self, mock_llm_provider):
-        """Test that web search is triggered after max correction retries"""
-        from src.core.edges import route_after_evaluation
+from src.agents.web_search_agent import (
+    _get_tavily_cache,
+    WebSearchAgent,
+    TavilyResult,
+    OptimizedQuery,
+    WebResultRelevance,
+)
 
-        # Simulate state after max retries with low relevance
-        state = {
-            "avg_relevance": 0.3,
-            "high_relevance_count": 0,
-            "retry_count": 2,  # Max retries reached
-        }
+# Structured LLM outputs shared by the web search agent tests
+_OPTIMIZED_QUERY = OptimizedQuery(optimized_query="test query", search_focus="general")
+_RELEVANCE = WebResultRelevance(
+    content_relevance=0.8,
+    source_reliability=0.9,
+    information_completeness=0.8,
+    overall_score=0.85,
+    useful_excerpt="Useful content",
+    should_include=True,
+)
 
-        result = route_after_evaluation(state)
+_DOCKER_DOC = Document.model_construct(
+    content="Docker deployment guide",
+    metadata=DocumentMetadata.model_construct(
+        source="https://docs.docker.com",
+        title="Docker Deployment",
+    ),
+    combined_score=0.85,
+)
+_DOCKER_GUIDE_DOC = Document.model_construct(
+    content="Docker deployment instructions",
+    metadata=DocumentMetadata.model_construct(
+        source="https://docs.docker.com/guide",
+        title="Docker Guide",
+    ),
+)
 
-        assert result == "web_search"
 
-    @pytest.mark.asyncio
-    async def test_web_search_not_triggered_with_high_relevance(self, mock_llm_provider):
-        """Test that web search is not triggered when relevance is sufficient"""
-        from src.core.edges import route_after_evaluation
+def make_llm(*returns):
+    """LLM provider mock whose generate_structured yields the given outputs in order"""
+    llm = AsyncMock()
+    llm.generate_structured = AsyncMock(side_effect=list(returns))
+    return llm
 
-        state = {
-            "avg_relevance": 0.9,
-            "high_relevance_count": 3,
-            "retry_count": 0,
-        }
 
-        result = route_after_evaluation(state)
+class TestWebSearchFallback:
+    """Integration tests for web search fallback behavior"""
 
-        assert result == "generate"
+    async def test_health_check(self, async_client):
+        """Verify API is running"""
+        response = await async_client.get("/health")
+        assert response.status_code == 200
 
 
 class TestWebSearchAgent:
     """Test web search agent functionality"""
 
-    @pytest.fixture
-    def agent(self, mock_llm_provider):
-        """Create agent with mocked LLM"""
+    @pytest.fixture(scope="class")
+    def shared_agent(self, mock_llm_provider):
+        """Agent built once for the class"""
         agent = WebSearchAgent(llm_provider=mock_llm_provider)
         agent.api_key = "test_api_key"
         return agent
 
-    @pytest.mark.asyncio
-    async def test_search_returns_documents(self, agent, mock_llm_provider):
-        """Test that search returns Document objects"""
-        from src.agents.web_search_agent import OptimizedQuery, WebResultRelevance
+    @pytest.fixture
+    def agent(self, shared_agent, mock_llm_provider):
+        """Shared agent with its LLM reset to the session mock"""
+        shared_agent.llm = mock_llm_provider
+        return shared_agent
 
-        mock_llm_provider.generate_structured = AsyncMock(
-            side_effect=[
-                OptimizedQuery(optimized_query="test query", search_focus="general"),
-                WebResultRelevance(
-                    content_relevance=0.8,
-                    source_reliability=0.9,
-                    information_completeness=0.8,
-                    overall_score=0.85,
-                    useful_excerpt="Useful content",
-                    should_include=True,
-                ),
-            ]
-        )
+    async def test_search_returns_documents(self, agent):
+        """Test that search returns Document objects"""
+        agent.llm = make_llm(_OPTIMIZED_QUERY, _RELEVANCE)
 
         with patch.object(agent, "_tavily_search") as mock_tavily:
             mock_tavily.return_value = [
@@ -102,24 +100,9 @@ class TestWebSearchAgent:
 
         assert all(isinstance(r, Document) for r in results)
 
-    @pytest.mark.asyncio
-    async def test_web_results_have_correct_metadata(self, agent, mock_llm_provider):
+    async def test_web_results_have_correct_metadata(self, agent):
         """Test that web results have correct metadata"""
-        from src.agents.web_search_agent import OptimizedQuery, WebResultRelevance
-
-        mock_llm_provider.generate_structured = AsyncMock(
-            side_effect=[
-                OptimizedQuery(optimized_query="test", search_focus="general"),
-                WebResultRelevance(
-                    content_relevance=0.8,
-                    source_reliability=0.9,
-                    information_completeness=0.8,
-                    overall_score=0.8,
-                    useful_excerpt="Content",
-                    should_include=True,
-                ),
-            ]
-        )
+        agent.llm = make_llm(_OPTIMIZED_QUERY, _RELEVANCE)
 
         with patch.object(agent, "_tavily_search") as mock_tavily:
             mock_tavily.return_value = [
@@ -138,11 +121,69 @@ class TestWebSearchAgent:
             assert results[0].metadata.title == "Docker Guide"
             assert results[0].metadata.section == "web_search"
 
+    async def test_result_evaluations_run_concurrently(self, agent):
+        """Test that per-result relevance evaluations fan out instead of running serially"""
+        delay = 0.05
+        outputs = iter([_OPTIMIZED_QUERY] + [_RELEVANCE] * 4)
+
+        async def slow_generate_structured(**kwargs):
+            await asyncio.sleep(delay)
+            return next(outputs)
+
+        agent.llm = AsyncMock()
+        agent.llm.generate_structured = AsyncMock(side_effect=slow_generate_structured)
+
+        tavily_results = [
+            TavilyResult(
+                title=f"Result {i}",
+                url=f"https://example.com/{i}",
+                content=f"Content {i}",
+                score=0.9,
+            )
+            for i in range(4)
+        ]
+
+        with patch.object(agent, "_tavily_search", return_value=tavily_results):
+            start = time.perf_counter()
+            results = await agent.search("test query", optimize_query=True)
+            elapsed = time.perf_counter() - start
+
+        assert agent.llm.generate_structured.await_count == 1 + len(tavily_results)
+        assert len(results) == len(tavily_results)
+        # One optimization call plus one concurrent round of evaluations
+        assert elapsed < delay * (1 + len(tavily_results))
+
+    async def test_results_ranked_by_combined_score(self, agent):
+        """Test that web results come back highest combined score first"""
+        scores = [0.4, 0.9, 0.6, 0.9]
+        agent.llm = make_llm(
+            *(_RELEVANCE.model_copy(update={"overall_score": s}) for s in scores)
+        )
+
+        tavily_results = [
+            TavilyResult(
+                title=f"Result {i}",
+                url=f"https://example.com/{i}",
+                content=f"Content {i}",
+                score=0.9,
+            )
+            for i in range(len(scores))
+        ]
+
+        with patch.object(agent, "_tavily_search", return_value=tavily_results):
+            results = await agent.search("test query", optimize_query=False)
+
+        assert [r.metadata.source for r in results] == [
+            "https://example.com/1",
+            "https://example.com/3",
+            "https://example.com/2",
+            "https://example.com/0",
+        ]
+
 
 class TestWebSearchNode:
     """Test web search LangGraph node"""
 
-    @pytest.mark.asyncio
     async def test_web_search_node_sets_disclaimer(self, mock_llm_provider):
         """Test that web search node sets needs_disclaimer flag"""
         from src.core.nodes import web_search_node
@@ -162,7 +203,6 @@ class TestWebSearchNode:
         assert result["web_search_triggered"] is True
         assert result["needs_disclaimer"] is True
 
-    @pytest.mark.asyncio
     async def test_web_search_node_returns_results(self, mock_llm_provider):
         """Test that web search node returns results"""
         from src.core.nodes import web_search_node
@@ -174,17 +214,8 @@ class TestWebSearchNode:
             "error_log": [],
         }
 
-        mock_doc = Document(
-            content="Docker deployment guide",
-            metadata=DocumentMetadata(
-                source="https://docs.docker.com",
-                title="Docker Deployment",
-            ),
-            combined_score=0.85,
-        )
-
         with patch("src.agents.web_search_agent.WebSearchAgent.search") as mock_search:
-            mock_search.return_value = [mock_doc]
+            mock_search.return_value = [_DOCKER_DOC]
 
             result = await web_search_node(state)
 
@@ -196,7 +227,6 @@ class TestWebSearchNode:
 class TestWebSearchResponseGeneration:
     """Test response generation with web search results"""
 
-    @pytest.mark.asyncio
     async def test_response_includes_web_sources(self, mock_llm_provider):
         """Test that generated response includes web sources"""
         from src.rag.response_generator import ResponseGenerator
@@ -212,37 +242,130 @@ class TestWebSearchResponseGeneration:
 
         generator = ResponseGenerator(llm_provider=mock_llm_provider)
 
-        web_doc = Document(
-            content="Docker deployment instructions",
-            metadata=DocumentMetadata(
-                source="https://docs.docker.com/guide",
-                title="Docker Guide",
-            ),
-        )
-
         result = await generator.generate(
             query="Docker deployment",
             documents=[],
-            web_results=[web_doc],
+            web_results=[_DOCKER_GUIDE_DOC],
         )
 
         assert result.response != ""
         assert "https://docs.docker.com/guide" in result.sources
 
 
+class _StubTavilyClient:
+    """httpx.AsyncClient stand-in counting POSTs; fails while `failing` is set"""
+
+    posts = 0
+    failing = False
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def post(self, url, json=None):
+        type(self).posts += 1
+        request = httpx.Request("POST", url)
+        if type(self).failing:
+            return httpx.Response(503, request=request)
+        return httpx.Response(
+            200,
+            request=request,
+            json={
+                "results": [
+                    {
+                        "title": "Docker Guide",
+                        "url": "https://docs.docker.com/guide",
+                        "content": "Docker documentation",
+                        "score": 0.9,
+                    }
+                ]
+            },
+        )
+
+
+class TestWebSearchCaching:
+    """Test that repeated graph runs reuse only successful Tavily responses"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_tavily_cache(self):
+        """Each test starts (and leaves) the shared Tavily cache empty"""
+        _get_tavily_cache().invalidate()
+        yield
+        _get_tavily_cache().invalidate()
+
+    @pytest.fixture
+    def tavily_client(self, monkeypatch):
+        """Route Tavily calls to a fresh _StubTavilyClient"""
+        client = type("TavilyClient", (_StubTavilyClient,), {})
+        monkeypatch.setattr(httpx, "AsyncClient", client)
+        return client
+
+    @pytest.fixture
+    def web_search_graph(self, monkeypatch):
+        """Graph running the real web_search_node with a Tavily-enabled agent"""
+        from langgraph.graph import StateGraph, END
+
+        from src.core.nodes import web_search_node
+        from src.core.state import RAGState
+
+        async def generate_structured(prompt, output_schema):
+            return _OPTIMIZED_QUERY if output_schema is OptimizedQuery else _RELEVANCE
+
+        agent = WebSearchAgent(llm_provider=SimpleNamespace(generate_structured=generate_structured))
+        agent.api_key = "test_api_key"
+        monkeypatch.setattr("src.core.nodes.WebSearchAgent", lambda: agent)
+
+        graph = StateGraph(RAGState)
+        graph.add_node("web_search", web_search_node)
+        graph.set_entry_point("web_search")
+        graph.add_edge("web_search", END)
+        return graph.compile()
+
+    async def _run(self, orchestrator, graph):
+        from src.core.state import create_initial_state
+
+        state = create_initial_state("Docker 배포 방법은?", "test-session")
+        return await orchestrator._run_graph(state, graph=graph)
+
+    async def test_repeated_search_hits_cache(self, orchestrator, web_search_graph, tavily_client):
+        """Test that a second run of the same query is served from the Tavily cache"""
+        before = _get_tavily_cache().stats()
+        first = await self._run(orchestrator, web_search_graph)
+        second = await self._run(orchestrator, web_search_graph)
+        after = _get_tavily_cache().stats()
+
+        assert tavily_client.posts == 1
+        assert after["hits"] - before["hits"] == 1
+        assert len(first["web_results"]) == len(second["web_results"]) == 1
+
+    async def test_failed_search_is_not_cached(self, orchestrator, web_search_graph, tavily_client):
+        """Test that a Tavily failure doesn't pin the query to empty results"""
+        tavily_client.failing = True
+        failed = await self._run(orchestrator, web_search_graph)
+
+        tavily_client.failing = False
+        recovered = await self._run(orchestrator, web_search_graph)
+
+        assert tavily_client.posts == 2
+        assert failed["web_results"] == []
+        assert len(recovered["web_results"]) == 1
+
+
 class TestRetrievalSourceType:
     """Test retrieval source type determination"""
 
-    def test_vector_source(self):
+    def test_vector_source(self, orchestrator):
         """Test vector-only retrieval source"""
-        from src.core.orchestrator import RAGOrchestrator
-
         state = {
             "web_search_triggered": False,
-            "retrieved_docs": [MagicMock()],
+            "retrieved_docs": [object()],
         }
 
-        orchestrator = RAGOrchestrator()
         # Internal method test would go here
 
     def test_web_source(self):
@@ -258,7 +381,7 @@ class TestRetrievalSourceType:
         """Test hybrid retrieval source"""
         state = {
             "web_search_triggered": True,
-            "retrieved_docs": [MagicMock()],
+            "retrieved_docs": [object()],
         }
         # When both web and vector docs exist
         # retrieval_source should be HYBRID
@@ -1,45 +1,59 @@
 """Unit tests for Corrective RAG Engine"""
 
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
-from src.rag.corrective_engine import CorrectiveEngine, CorrectionAction
 from src.core.models import Document, DocumentMetadata, RewriteStrategy
+from src.rag.corrective_engine import CorrectiveEngine, CorrectionAction
+
+_TEST_DOC = Document.model_construct(
+    content="Test content",
+    metadata=DocumentMetadata.model_construct(source="test.md"),
+    embedding_score=0.8,
+)
+
+_METRICS_SUFFICIENT = MappingProxyType({
+    "avg_relevance": 0.85,
+    "high_relevance_count": 2,
+    "sufficient": True
+})
+
+
+def _counting_async(return_value):
+    """Async stub returning a fixed value and recording its calls in .calls"""
+    calls = []
+
+    async def stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        return return_value
+
+    stub.calls = calls
+    return stub
 
 
 class TestCorrectiveEngine:
     """Test cases for CorrectiveEngine"""
 
+    # Stubs expose only the collaborator methods CorrectiveEngine calls
     @pytest.fixture
     def mock_retriever(self):
-        retriever = MagicMock()
-        retriever.retrieve = AsyncMock(return_value=[
-            Document(
-                content="Test content",
-                metadata=DocumentMetadata(source="test.md"),
-                embedding_score=0.8
-            )
-        ])
-        return retriever
+        return SimpleNamespace(retrieve=_counting_async([_TEST_DOC]))
 
     @pytest.fixture
     def mock_evaluator(self):
-        evaluator = MagicMock()
-        evaluator.evaluate_batch = AsyncMock()
-        evaluator.calculate_metrics = MagicMock(return_value={
-            "avg_relevance": 0.85,
-            "high_relevance_count": 2,
-            "sufficient": True
-        })
-        return evaluator
+        return SimpleNamespace(
+            evaluate_batch=_counting_async([]),
+            calculate_metrics=lambda *args, **kwargs: _METRICS_SUFFICIENT,
+        )
 
     @pytest.fixture
     def mock_rewriter(self):
-        rewriter = MagicMock()
-        rewriter.rewrite_auto = AsyncMock(
-            return_value=("rewritten query", RewriteStrategy.SYNONYM_EXPANSION)
+        return SimpleNamespace(
+            rewrite_auto=_counting_async(
+                ("rewritten query", RewriteStrategy.SYNONYM_EXPANSION)
+            )
         )
-        return rewriter
 
     @pytest.fixture
     def engine(self, mock_retriever, mock_evaluator, mock_rewriter):
@@ -111,23 +125,20 @@ class TestCorrectiveEngine:
 
         assert engine.determine_next_action(state) == CorrectionAction.WEB_SEARCH
 
-    @pytest.mark.asyncio
     async def test_retrieve_and_evaluate(self, engine, mock_retriever, mock_evaluator):
         """Test retrieve and evaluate pipeline"""
-        mock_evaluator.evaluate_batch = AsyncMock(return_value=[])
-        mock_evaluator.calculate_metrics = MagicMock(return_value={
+        mock_evaluator.calculate_metrics = lambda *args, **kwargs: {
             "avg_relevance": 0.8,
             "high_relevance_count": 1,
             "sufficient": False
-        })
+        }
 
         docs, evals, metrics = await engine.retrieve_and_evaluate("test query")
 
-        mock_retriever.retrieve.assert_called_once()
-        mock_evaluator.evaluate_batch.assert_called_once()
+        assert len(mock_retriever.retrieve.calls) == 1
+        assert len(mock_evaluator.evaluate_batch.calls) == 1
         assert "avg_relevance" in metrics
 
-    @pytest.mark.asyncio
     async def test_rewrite_and_retry(self, engine, mock_rewriter):
         """CR-004: Test retry count increment"""
         result = await engine.rewrite_and_retry(
@@ -141,16 +152,16 @@ class TestCorrectiveEngine:
         assert result["retry_count"] == 1
         assert result["correction_triggered"] is True
         assert len(result["rewritten_queries"]) > 1
-        mock_rewriter.rewrite_auto.assert_called_once()
+        assert len(mock_rewriter.rewrite_auto.calls) == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_run_correction_loop_no_correction_needed(self, engine, mock_evaluator):
         """Test loop when no correction needed"""
-        mock_evaluator.calculate_metrics = MagicMock(return_value={
+        mock_evaluator.calculate_metrics = lambda *args, **kwargs: {
             "avg_relevance": 0.9,
             "high_relevance_count": 3,
             "sufficient": True
-        })
+        }
 
         result = await engine.run_correction_loop("test query")
 
@@ -158,14 +169,15 @@ class TestCorrectiveEngine:
         assert result["retry_count"] == 0
         assert result["action_taken"] == "proceed"
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_run_correction_loop_with_correction(self, engine, mock_evaluator, mock_rewriter):
         """Test loop with correction triggered"""
         # First call returns low relevance, second returns high
-        mock_evaluator.calculate_metrics = MagicMock(side_effect=[
+        metrics = iter([
             {"avg_relevance": 0.4, "high_relevance_count": 0, "sufficient": False},
             {"avg_relevance": 0.9, "high_relevance_count": 2, "sufficient": True},
         ])
+        mock_evaluator.calculate_metrics = lambda *args, **kwargs: next(metrics)
 
         result = await engine.run_correction_loop("test query")
 
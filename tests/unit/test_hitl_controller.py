@@ -1,18 +1,17 @@
 """Unit tests for HITL Controller"""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.agents.hitl_controller import HITLController, ClarificationResult, RefinedQueryResult
 from src.core.models import AmbiguityType, ClarificationOutput, HITLResponse
+from src.agents.hitl_controller import HITLController, ClarificationResult, RefinedQueryResult
 
 
 class TestHITLController:
     """Test cases for HITLController"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def controller(self, mock_llm_provider):
-        """Create controller with mocked LLM"""
+        """Controller with mocked LLM, shared by the class"""
         return HITLController(llm_provider=mock_llm_provider)
 
     def test_should_clarify_when_ambiguous(self, controller):
@@ -51,14 +50,11 @@ class TestHITLController:
         )
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_generate_clarification_success(self, controller, mock_llm_provider):
         """Test successful clarification generation"""
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=ClarificationResult(
-                clarification_question="어떤 종류의 배포를 원하시나요?",
-                options=["Docker 배포", "Kubernetes 배포", "직접 서버 배포"],
-            )
+        mock_llm_provider.generate_structured.return_value = ClarificationResult.model_construct(
+            clarification_question="어떤 종류의 배포를 원하시나요?",
+            options=["Docker 배포", "Kubernetes 배포", "직접 서버 배포"],
         )
 
         result = await controller.generate_clarification(
@@ -72,10 +68,9 @@ class TestHITLController:
         assert "배포" in result.clarification_question
         assert len(result.options) >= 2
 
-    @pytest.mark.asyncio
     async def test_generate_clarification_fallback(self, controller, mock_llm_provider):
         """Test fallback when LLM fails"""
-        mock_llm_provider.generate_structured = AsyncMock(side_effect=Exception("LLM Error"))
+        mock_llm_provider.generate_structured.side_effect = Exception("LLM Error")
 
         result = await controller.generate_clarification(
             query="뭔가 알려줘",
@@ -88,13 +83,10 @@ class TestHITLController:
         assert result.clarification_question != ""
         assert len(result.options) >= 2
 
-    @pytest.mark.asyncio
     async def test_refine_query_with_selected_option(self, controller, mock_llm_provider):
         """Test query refinement with selected option"""
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=RefinedQueryResult(
-                refined_query="Docker를 사용한 컨테이너 배포 방법",
-            )
+        mock_llm_provider.generate_structured.return_value = RefinedQueryResult.model_construct(
+            refined_query="Docker를 사용한 컨테이너 배포 방법",
         )
 
         result = await controller.refine_query(
@@ -105,13 +97,10 @@ class TestHITLController:
 
         assert "Docker" in result
 
-    @pytest.mark.asyncio
     async def test_refine_query_with_custom_input(self, controller, mock_llm_provider):
         """Test query refinement with custom input"""
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=RefinedQueryResult(
-                refined_query="AWS ECS를 사용한 컨테이너 배포 방법",
-            )
+        mock_llm_provider.generate_structured.return_value = RefinedQueryResult.model_construct(
+            refined_query="AWS ECS를 사용한 컨테이너 배포 방법",
         )
 
         result = await controller.refine_query(
@@ -140,19 +129,17 @@ class TestHITLController:
         result = controller.process_user_response(response)
         assert result == ""
 
-    def test_get_default_options_multiple_interpretation(self, controller):
-        """Test default options for multiple interpretation"""
-        options = controller._get_default_options(AmbiguityType.MULTIPLE_INTERPRETATION)
-        assert len(options) >= 2
-
-    def test_get_default_options_missing_context(self, controller):
-        """Test default options for missing context"""
-        options = controller._get_default_options(AmbiguityType.MISSING_CONTEXT)
-        assert len(options) >= 2
-
-    def test_get_default_options_vague_term(self, controller):
-        """Test default options for vague term"""
-        options = controller._get_default_options(AmbiguityType.VAGUE_TERM)
+    @pytest.mark.parametrize(
+        "ambiguity_type",
+        [
+            AmbiguityType.MULTIPLE_INTERPRETATION,
+            AmbiguityType.MISSING_CONTEXT,
+            AmbiguityType.VAGUE_TERM,
+        ],
+    )
+    def test_get_default_options(self, controller, ambiguity_type):
+        """Test default options for each ambiguity type"""
+        options = controller._get_default_options(ambiguity_type)
         assert len(options) >= 2
 
     def test_get_default_clarification(self, controller):
@@ -165,3 +152,23 @@ class TestHITLController:
         assert isinstance(result, ClarificationOutput)
         assert result.clarification_question != ""
         assert len(result.options) >= 2
+
+    @pytest.mark.parametrize(
+        "question,options,expected",
+        [
+            ("어떤 배포인가요?", ["Docker", " Kubernetes "], ["Docker", "Kubernetes"]),
+            ("어떤 배포인가요?", [f"옵션 {i}" for i in range(6)], [f"옵션 {i}" for i in range(5)]),
+            ("어떤 배포인가요?", ["Docker", ""], None),
+            ("", ["Docker", "Kubernetes"], None),
+            (None, None, None),
+        ],
+        ids=["valid", "too_many", "too_few", "no_question", "missing"],
+    )
+    def test_clamp_clarification(self, controller, question, options, expected):
+        """Test drafted clarifications are clamped or rejected"""
+        result = controller.clamp_clarification(question, options)
+
+        if expected is None:
+            assert result is None
+        else:
+            assert result.options == expected
@@ -1,56 +1,91 @@
 """Unit tests for Relevance Evaluator"""
 
+from functools import lru_cache
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
-from src.rag.relevance_evaluator import RelevanceEvaluator
 from src.core.models import (
     Document,
     DocumentMetadata,
     RelevanceLevel,
     RelevanceEvaluationOutput,
 )
+from src.rag.relevance_evaluator import RelevanceEvaluator
+
+_RELEVANT_DOC = Document.model_construct(
+    content="Docker를 사용한 배포 방법: 1. Dockerfile 작성 2. 이미지 빌드 3. 컨테이너 실행",
+    metadata=DocumentMetadata.model_construct(
+        source="deployment.md",
+        title="배포 가이드",
+    ),
+    embedding_score=0.9,
+)
+
+_IRRELEVANT_DOC = Document.model_construct(
+    content="회사 휴가 정책: 연차 15일, 병가 5일 제공됩니다.",
+    metadata=DocumentMetadata.model_construct(
+        source="hr-policy.md",
+        title="HR 정책",
+    ),
+    embedding_score=0.3,
+)
+
+
+@lru_cache(maxsize=None)
+def _evaluation(score: float, level: RelevanceLevel) -> RelevanceEvaluationOutput:
+    """Relevance evaluation with empty reason and useful parts (shared, read-only)"""
+    return RelevanceEvaluationOutput.model_construct(
+        relevance_score=score, relevance_level=level, reason="", useful_parts=[]
+    )
+
+
+_SUFFICIENT_EVALUATIONS = (
+    _evaluation(0.9, RelevanceLevel.HIGH),
+    _evaluation(0.85, RelevanceLevel.HIGH),
+    _evaluation(0.6, RelevanceLevel.MEDIUM),
+)
+
+_INSUFFICIENT_EVALUATIONS = (
+    _evaluation(0.4, RelevanceLevel.LOW),
+    _evaluation(0.3, RelevanceLevel.LOW),
+)
+
+_FILTER_DOCS = (
+    Document.model_construct(content="High", metadata=DocumentMetadata.model_construct(source="a.md")),
+    Document.model_construct(content="Medium", metadata=DocumentMetadata.model_construct(source="b.md")),
+    Document.model_construct(content="Low", metadata=DocumentMetadata.model_construct(source="c.md")),
+)
+
+_FILTER_EVALUATIONS = (
+    _evaluation(0.9, RelevanceLevel.HIGH),
+    _evaluation(0.6, RelevanceLevel.MEDIUM),
+    _evaluation(0.3, RelevanceLevel.LOW),
+)
 
 
 class TestRelevanceEvaluator:
     """Test cases for RelevanceEvaluator"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def evaluator(self, mock_llm_provider):
         return RelevanceEvaluator(llm_provider=mock_llm_provider)
 
+    # evaluate() writes scores back onto the document, so hand out copies
     @pytest.fixture
     def sample_relevant_doc(self):
-        return Document(
-            content="Docker를 사용한 배포 방법: 1. Dockerfile 작성 2. 이미지 빌드 3. 컨테이너 실행",
-            metadata=DocumentMetadata(
-                source="deployment.md",
-                title="배포 가이드",
-            ),
-            embedding_score=0.9,
-        )
+        return _RELEVANT_DOC.model_copy()
 
     @pytest.fixture
     def sample_irrelevant_doc(self):
-        return Document(
-            content="회사 휴가 정책: 연차 15일, 병가 5일 제공됩니다.",
-            metadata=DocumentMetadata(
-                source="hr-policy.md",
-                title="HR 정책",
-            ),
-            embedding_score=0.3,
-        )
+        return _IRRELEVANT_DOC.model_copy()
 
-    @pytest.mark.asyncio
     async def test_evaluate_high_relevance(self, evaluator, mock_llm_provider, sample_relevant_doc):
         """RE-001: High relevance document evaluation"""
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=RelevanceEvaluationOutput(
-                relevance_score=0.9,
-                relevance_level=RelevanceLevel.HIGH,
-                reason="Document directly addresses Docker deployment",
-                useful_parts=["Dockerfile 작성", "이미지 빌드"],
-            )
+        mock_llm_provider.generate_structured.return_value = RelevanceEvaluationOutput.model_construct(
+            relevance_score=0.9,
+            relevance_level=RelevanceLevel.HIGH,
+            reason="Document directly addresses Docker deployment",
+            useful_parts=["Dockerfile 작성", "이미지 빌드"],
         )
 
         result = await evaluator.evaluate("Docker 배포 방법", sample_relevant_doc)
@@ -59,7 +94,6 @@ class TestRelevanceEvaluator:
         assert result.relevance_level == RelevanceLevel.HIGH
         assert len(result.useful_parts) > 0
 
-    @pytest.mark.asyncio
     async def test_evaluate_low_relevance(self, evaluator, mock_llm_provider, sample_irrelevant_doc):
         """RE-003: Low relevance document skipped by embedding filter"""
         # With low embedding score, should skip LLM evaluation
@@ -68,7 +102,6 @@ class TestRelevanceEvaluator:
         assert result.relevance_score < 0.5
         assert result.relevance_level == RelevanceLevel.LOW
 
-    @pytest.mark.asyncio
     async def test_score_to_level_mapping(self, evaluator):
         """RE-008: Score to level mapping is consistent"""
         assert evaluator._score_to_level(0.9) == RelevanceLevel.HIGH
@@ -78,23 +111,9 @@ class TestRelevanceEvaluator:
         assert evaluator._score_to_level(0.49) == RelevanceLevel.LOW
         assert evaluator._score_to_level(0.0) == RelevanceLevel.LOW
 
-    @pytest.mark.asyncio
     async def test_calculate_metrics(self, evaluator):
         """Test metrics calculation"""
-        evaluations = [
-            RelevanceEvaluationOutput(
-                relevance_score=0.9, relevance_level=RelevanceLevel.HIGH,
-                reason="", useful_parts=[]
-            ),
-            RelevanceEvaluationOutput(
-                relevance_score=0.85, relevance_level=RelevanceLevel.HIGH,
-                reason="", useful_parts=[]
-            ),
-            RelevanceEvaluationOutput(
-                relevance_score=0.6, relevance_level=RelevanceLevel.MEDIUM,
-                reason="", useful_parts=[]
-            ),
-        ]
+        evaluations = list(_SUFFICIENT_EVALUATIONS)
 
         metrics = evaluator.calculate_metrics(evaluations)
 
@@ -104,47 +123,19 @@ class TestRelevanceEvaluator:
         assert metrics["avg_relevance"] > 0.7
         assert metrics["sufficient"] is True  # 2 high relevance docs
 
-    @pytest.mark.asyncio
     async def test_calculate_metrics_insufficient(self, evaluator):
         """Test metrics when insufficient relevance"""
-        evaluations = [
-            RelevanceEvaluationOutput(
-                relevance_score=0.4, relevance_level=RelevanceLevel.LOW,
-                reason="", useful_parts=[]
-            ),
-            RelevanceEvaluationOutput(
-                relevance_score=0.3, relevance_level=RelevanceLevel.LOW,
-                reason="", useful_parts=[]
-            ),
-        ]
+        evaluations = list(_INSUFFICIENT_EVALUATIONS)
 
         metrics = evaluator.calculate_metrics(evaluations)
 
         assert metrics["high_relevance_count"] == 0
         assert metrics["sufficient"] is False
 
-    @pytest.mark.asyncio
     async def test_filter_relevant_documents(self, evaluator):
         """Test filtering documents by relevance level"""
-        docs = [
-            Document(content="High", metadata=DocumentMetadata(source="a.md")),
-            Document(content="Medium", metadata=DocumentMetadata(source="b.md")),
-            Document(content="Low", metadata=DocumentMetadata(source="c.md")),
-        ]
-        evals = [
-            RelevanceEvaluationOutput(
-                relevance_score=0.9, relevance_level=RelevanceLevel.HIGH,
-                reason="", useful_parts=[]
-            ),
-            RelevanceEvaluationOutput(
-                relevance_score=0.6, relevance_level=RelevanceLevel.MEDIUM,
-                reason="", useful_parts=[]
-            ),
-            RelevanceEvaluationOutput(
-                relevance_score=0.3, relevance_level=RelevanceLevel.LOW,
-                reason="", useful_parts=[]
-            ),
-        ]
+        docs = list(_FILTER_DOCS)
+        evals = list(_FILTER_EVALUATIONS)
 
         filtered_docs, filtered_evals = evaluator.filter_relevant(
             docs, evals, min_level=RelevanceLevel.MEDIUM
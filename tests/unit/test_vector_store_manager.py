@@ -0,0 +1,252 @@
+"""Unit tests for VectorStoreManager"""
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.vectorstore.embeddings import EmbeddingProvider
+from src.vectorstore.manager import VectorStoreManager
+
+
+class TestVectorStoreManager:
+    """Test cases for VectorStoreManager"""
+
+    @pytest.fixture
+    def embedding_provider(self):
+        provider = MagicMock(spec=EmbeddingProvider)
+        provider.get_model_name.return_value = "test-model"
+        provider.get_embeddings = AsyncMock(
+            side_effect=lambda texts: [[float(len(t)), 0.5] for t in texts]
+        )
+        return provider
+
+    @pytest.fixture
+    def manager(self, tmp_path, mock_chroma_client, embedding_provider):
+        with patch(
+            "src.vectorstore.manager.chromadb.PersistentClient",
+            return_value=mock_chroma_client,
+        ):
+            return VectorStoreManager(
+                persist_directory=str(tmp_path),
+                collection_name="test",
+                embedding_provider=embedding_provider,
+            )
+
+    async def test_add_documents_skips_cached_embeddings(self, manager, embedding_provider):
+        """VS-001: Re-adding unchanged documents does not re-embed them"""
+        await manager.add_documents(["alpha", "beta"], ids=["a", "b"])
+        await manager.add_documents(["alpha", "gamma!"], ids=["a2", "c"])
+
+        calls = [c.args[0] for c in embedding_provider.get_embeddings.call_args_list]
+        assert calls == [["alpha", "beta"], ["gamma!"]]
+
+        embeddings = manager.collection.add.call_args.kwargs["embeddings"]
+        assert embeddings.dtype == np.float32
+        assert embeddings.tolist() == [[5.0, 0.5], [6.0, 0.5]]
+
+    async def test_update_document_uses_embedding_cache(self, manager, embedding_provider):
+        """VS-002: Updating with previously embedded text hits the cache"""
+        await manager.add_documents(["alpha"], ids=["a"])
+        await manager.update_document("a", document="alpha")
+
+        assert embedding_provider.get_embeddings.call_count == 1
+
+    async def test_search_results_cached_until_write(self, manager, mock_chroma_client):
+        """VS-003: Repeated searches hit the cache until the collection changes"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+
+        first = await manager.search("Docker 배포", n_results=5)
+        second = await manager.search("Docker 배포", n_results=5)
+
+        assert first == second
+        assert collection.query.call_count == 1
+
+        await manager.add_documents(["new doc"], ids=["n"])
+        await manager.search("Docker 배포", n_results=5)
+
+        assert collection.query.call_count == 2
+
+    async def test_search_cache_shared_across_managers(
+        self, manager, tmp_path, mock_chroma_client, embedding_provider
+    ):
+        """VS-012: A write through one manager invalidates another's cached searches"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+        other = VectorStoreManager(
+            persist_directory=str(tmp_path),
+            collection_name="test",
+            embedding_provider=embedding_provider,
+        )
+
+        await manager.search("Docker 배포", n_results=5)
+        await other.add_documents(["new doc"], ids=["n"])
+        await manager.search("Docker 배포", n_results=5)
+
+        assert collection.query.call_count == 2
+
+    async def test_cached_results_isolated_from_callers(self, manager):
+        """VS-014: Mutating returned results doesn't corrupt later cache hits"""
+        first = await manager.search("Docker 배포", n_results=5)
+        first[0]["content"] = "mutated"
+        first[0]["metadata"]["source"] = "mutated.md"
+
+        second = await manager.search("Docker 배포", n_results=5)
+
+        assert second[0]["content"] == "Test document content about deployment"
+        assert second[0]["metadata"]["source"] == "test.md"
+
+    async def test_search_batch_embeds_once_in_input_order(
+        self, manager, embedding_provider, mock_chroma_client
+    ):
+        """VS-004: Batch search embeds distinct queries in one call and keeps order"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+        collection.query.return_value = {
+            "documents": [["doc A"], ["doc B"]],
+            "metadatas": [[{"source": "a.md"}], [{"source": "b.md"}]],
+            "distances": [[0.1], [0.2]],
+            "ids": [["a"], ["b"]],
+        }
+
+        results = await manager.search_batch(["q1", "q2", "q1"], n_results=1)
+
+        embedding_provider.get_embeddings.assert_called_once_with(["q1", "q2"])
+        assert collection.query.call_count == 1
+        assert [r[0]["id"] for r in results] == ["a", "b", "a"]
+
+    async def test_inmemory_search_bypasses_chroma_query(
+        self, manager, embedding_provider, mock_chroma_client
+    ):
+        """VS-005: In-memory mirror ranks by cosine without querying Chroma"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+        collection.get.return_value = {
+            "ids": ["x", "y"],
+            "embeddings": np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32),
+            "documents": ["doc X", "doc Y"],
+            "metadatas": [{"source": "x.md"}, None],
+        }
+        embedding_provider.get_embeddings = AsyncMock(return_value=[[0.1, 0.9]])
+        manager.use_inmemory_cache = True
+
+        results = await manager.search("query", n_results=1)
+
+        collection.query.assert_not_called()
+        assert [r["id"] for r in results] == ["y"]
+        assert results[0]["distance"] == pytest.approx(1 - 0.9 / np.hypot(0.1, 0.9))
+
+    async def test_update_documents_single_embedding_call(
+        self, manager, embedding_provider, mock_chroma_client
+    ):
+        """VS-006: Bulk update embeds all changed texts in one provider call"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+
+        await manager.update_documents(
+            ["a", "b", "c"],
+            documents=["one", "three", None],
+            metadatas=[None, None, {"source": "c.md"}],
+        )
+
+        embedding_provider.get_embeddings.assert_called_once_with(["one", "three"])
+        updates = [c.kwargs for c in collection.update.call_args_list]
+        assert [u["ids"] for u in updates] == [["a", "b"], ["c"]]
+        assert updates[0]["embeddings"].tolist() == [[3.0, 0.5], [5.0, 0.5]]
+        assert updates[1]["metadatas"] == [{"source": "c.md"}]
+
+    async def test_add_documents_pipelines_micro_batches(
+        self, manager, embedding_provider, mock_chroma_client
+    ):
+        """VS-007: Large ingests are embedded and written in micro-batches"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+        manager.INGEST_BATCH_SIZE = 2
+        documents = [f"doc {i}" for i in range(5)]
+
+        ids = await manager.add_documents(documents)
+
+        assert embedding_provider.get_embeddings.call_count == 3
+        added = [c.kwargs for c in collection.add.call_args_list]
+        assert len(added) == 3
+        assert sorted(i for a in added for i in a["ids"]) == sorted(ids)
+        assert sorted(d for a in added for d in a["documents"]) == documents
+
+    async def test_add_documents_pipeline_failure_keeps_group(
+        self, manager, embedding_provider
+    ):
+        """VS-013: A failed pipelined ingest raises the first error, chained to the group"""
+        manager.INGEST_BATCH_SIZE = 2
+        embedding_provider.get_embeddings = AsyncMock(side_effect=RuntimeError("embed failed"))
+
+        with pytest.raises(RuntimeError, match="embed failed") as exc_info:
+            await manager.add_documents([f"doc {i}" for i in range(5)])
+
+        assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+
+    async def test_failed_add_still_invalidates_search_cache(
+        self, manager, embedding_provider, mock_chroma_client
+    ):
+        """VS-015: A failed pipelined ingest drops cached searches (batches may be written)"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+        manager.INGEST_BATCH_SIZE = 2
+
+        await manager.search("Docker 배포", n_results=5)
+        embedding_provider.get_embeddings = AsyncMock(side_effect=RuntimeError("embed failed"))
+        with pytest.raises(RuntimeError):
+            await manager.add_documents([f"doc {i}" for i in range(5)])
+
+        embedding_provider.get_embeddings = AsyncMock(return_value=[[1.0, 0.5]])
+        await manager.search("Docker 배포", n_results=5)
+
+        assert collection.query.call_count == 2
+
+    async def test_add_documents_without_metadata_omits_metadatas(
+        self, manager, mock_chroma_client
+    ):
+        """VS-008: No shared placeholder metadata dict is sent to Chroma"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+
+        await manager.add_documents(["alpha", "beta"])
+
+        assert "metadatas" not in collection.add.call_args.kwargs
+
+    async def test_add_documents_embeds_duplicates_once(
+        self, manager, embedding_provider, mock_chroma_client
+    ):
+        """VS-009: Duplicate texts within one call are embedded once"""
+        collection = mock_chroma_client.get_or_create_collection.return_value
+
+        await manager.add_documents(["alpha", "beta", "alpha"])
+
+        embedding_provider.get_embeddings.assert_called_once_with(["alpha", "beta"])
+        assert collection.add.call_args.kwargs["embeddings"].shape == (3, 2)
+
+    async def test_search_formats_full_result_page(self, manager, mock_chroma_client):
+        """VS-010: All returned rows are formatted in distance order"""
+        results = await manager.search("Docker 배포", n_results=100)
+
+        assert len(results) == 100
+        assert results[0]["content"] == "Test document content about deployment"
+        distances = [r["distance"] for r in results]
+        assert distances == sorted(distances)
+
+    async def test_inmemory_search_large_collection(
+        self, tmp_path, mock_chroma_large, embedding_provider
+    ):
+        """VS-011: In-memory top-k matches a full sort on large collections"""
+        collection = mock_chroma_large.get_or_create_collection.return_value
+        matrix = collection.get.return_value["embeddings"]
+        query = np.random.default_rng(1).random(matrix.shape[1], dtype=np.float32)
+        embedding_provider.get_embeddings = AsyncMock(return_value=[query])
+
+        with patch(
+            "src.vectorstore.manager.chromadb.PersistentClient",
+            return_value=mock_chroma_large,
+        ):
+            manager = VectorStoreManager(
+                persist_directory=str(tmp_path),
+                embedding_provider=embedding_provider,
+                use_inmemory_cache=True,
+            )
+
+        results = await manager.search("query", n_results=10)
+
+        scores = (matrix / np.linalg.norm(matrix, axis=1, keepdims=True)) @ query
+        expected = [f"doc_{i + 1}" for i in np.argsort(-scores)[:10]]
+        assert [r["id"] for r in results] == expected
+        collection.query.assert_not_called()
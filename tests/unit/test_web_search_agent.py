@@ -1,35 +1,109 @@
 """Unit tests for Web Search Agent"""
 
+import httpx
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.core.models import Document
 from src.agents.web_search_agent import (
+    _get_tavily_cache,
     WebSearchAgent,
     OptimizedQuery,
     WebResultRelevance,
     TavilyResult,
 )
-from src.core.models import Document
+
+_TAVILY_PAYLOAD = {
+    "results": [
+        {
+            "title": "Docker Documentation",
+            "url": "https://docs.docker.com/",
+            "content": "Docker is a platform...",
+            "score": 0.9,
+        },
+        {
+            "title": "Docker Hub",
+            "url": "https://hub.docker.com/",
+            "content": "Container images...",
+            "score": 0.8,
+        },
+    ]
+}
+
+
+# Parsed Tavily results handed to search() in place of a live API call
+_TAVILY_RESULTS_DOCKER = (
+    TavilyResult.model_construct(
+        title="Docker Docs",
+        url="https://docs.docker.com/",
+        content="Docker documentation...",
+        score=0.9,
+    ),
+)
+
+
+class _StubTavilyResponse:
+    """httpx.Response stand-in carrying a fixed JSON payload"""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class _StubTavilyClient:
+    """httpx.AsyncClient stand-in that answers every POST with _TAVILY_PAYLOAD"""
+
+    posts = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def post(self, *args, **kwargs):
+        type(self).posts += 1
+        return _StubTavilyResponse(_TAVILY_PAYLOAD)
 
 
 class TestWebSearchAgent:
     """Test cases for WebSearchAgent"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def agent(self, mock_llm_provider):
-        """Create agent with mocked LLM"""
+        """Agent with mocked LLM, shared by the class"""
         agent = WebSearchAgent(llm_provider=mock_llm_provider)
         agent.api_key = "test_api_key"
         return agent
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def _clear_tavily_cache(self):
+        """Start each test with an empty Tavily response cache"""
+        _get_tavily_cache().invalidate()
+        yield
+        _get_tavily_cache().invalidate()
+
+    @pytest.fixture
+    def tavily_client(self, monkeypatch):
+        """Route Tavily HTTP calls to the stub client"""
+        _StubTavilyClient.posts = 0
+        monkeypatch.setattr(httpx, "AsyncClient", _StubTavilyClient)
+        return _StubTavilyClient
+
     async def test_optimize_query_success(self, agent, mock_llm_provider):
         """Test successful query optimization"""
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=OptimizedQuery(
-                optimized_query="Docker container deployment guide",
-                search_focus="documentation",
-            )
+        mock_llm_provider.generate_structured.return_value = OptimizedQuery.model_construct(
+            optimized_query="Docker container deployment guide",
+            search_focus="documentation",
         )
 
         result = await agent._optimize_query(
@@ -39,10 +113,9 @@ class TestWebSearchAgent:
 
         assert result == "Docker container deployment guide"
 
-    @pytest.mark.asyncio
     async def test_optimize_query_fallback(self, agent, mock_llm_provider):
         """Test query optimization fallback on error"""
-        mock_llm_provider.generate_structured = AsyncMock(side_effect=Exception("Error"))
+        mock_llm_provider.generate_structured.side_effect = Exception("Error")
 
         result = await agent._optimize_query(
             query="Docker 배포 방법",
@@ -51,43 +124,39 @@ class TestWebSearchAgent:
 
         assert result == "Docker 배포 방법"  # Returns original query
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient.post")
-    async def test_tavily_search_success(self, mock_post, agent):
+    async def test_tavily_search_success(self, agent, tavily_client):
         """Test successful Tavily API call"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "results": [
-                {
-                    "title": "Docker Documentation",
-                    "url": "https://docs.docker.com/",
-                    "content": "Docker is a platform...",
-                    "score": 0.9,
-                },
-                {
-                    "title": "Docker Hub",
-                    "url": "https://hub.docker.com/",
-                    "content": "Container images...",
-                    "score": 0.8,
-                },
-            ]
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        # Create async context manager mock
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock()
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            results = await agent._tavily_search("Docker deployment")
+        results = await agent._tavily_search("Docker deployment")
 
         assert len(results) == 2
         assert results[0].title == "Docker Documentation"
         assert results[0].url == "https://docs.docker.com/"
 
-    @pytest.mark.asyncio
+    async def test_tavily_search_cached(self, agent, tavily_client):
+        """Test repeated Tavily queries are served from the cache"""
+        before = _get_tavily_cache().stats()
+        first = await agent._tavily_search("Docker deployment")
+        second = await agent._tavily_search("Docker deployment")
+        after = _get_tavily_cache().stats()
+
+        assert second == first
+        assert tavily_client.posts == 1
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 1
+
+    async def test_tavily_search_cache_isolated_from_callers(self, agent, tavily_client):
+        """Test mutating returned Tavily results doesn't corrupt later cache hits"""
+        first = await agent._tavily_search("Docker deployment")
+        first.clear()
+
+        second = await agent._tavily_search("Docker deployment")
+        second.pop()
+
+        third = await agent._tavily_search("Docker deployment")
+
+        assert tavily_client.posts == 1
+        assert len(third) == 2
+
     async def test_tavily_search_no_api_key(self, mock_llm_provider):
         """Test Tavily search returns empty when no API key"""
         agent = WebSearchAgent(llm_provider=mock_llm_provider)
@@ -97,21 +166,18 @@ class TestWebSearchAgent:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_evaluate_result_success(self, agent, mock_llm_provider):
         """Test successful result evaluation"""
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=WebResultRelevance(
-                content_relevance=0.9,
-                source_reliability=0.8,
-                information_completeness=0.85,
-                overall_score=0.85,
-                useful_excerpt="Docker allows containerization...",
-                should_include=True,
-            )
+        mock_llm_provider.generate_structured.return_value = WebResultRelevance.model_construct(
+            content_relevance=0.9,
+            source_reliability=0.8,
+            information_completeness=0.85,
+            overall_score=0.85,
+            useful_excerpt="Docker allows containerization...",
+            should_include=True,
         )
 
-        result = TavilyResult(
+        result = TavilyResult.model_construct(
             title="Docker Guide",
             url="https://docs.docker.com/guide",
             content="Docker allows containerization of applications...",
@@ -123,20 +189,23 @@ class TestWebSearchAgent:
         assert evaluation.overall_score >= 0.8
         assert evaluation.should_include is True
 
-    def test_estimate_source_reliability_trusted(self, agent):
-        """Test source reliability for trusted domains"""
-        assert agent._estimate_source_reliability("https://docs.python.org/") == 0.9
-        assert agent._estimate_source_reliability("https://developer.mozilla.org/") == 0.9
-        assert agent._estimate_source_reliability("https://stackoverflow.com/") == 0.9
-
-    def test_estimate_source_reliability_docs(self, agent):
-        """Test source reliability for documentation sites"""
-        assert agent._estimate_source_reliability("https://docs.example.com/") == 0.8
-        assert agent._estimate_source_reliability("https://example.com/documentation/") == 0.8
-
-    def test_estimate_source_reliability_unknown(self, agent):
-        """Test source reliability for unknown domains"""
-        assert agent._estimate_source_reliability("https://random-blog.com/") == 0.6
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            # Trusted domains
+            ("https://docs.python.org/", 0.9),
+            ("https://developer.mozilla.org/", 0.9),
+            ("https://stackoverflow.com/", 0.9),
+            # Documentation sites
+            ("https://docs.example.com/", 0.8),
+            ("https://example.com/documentation/", 0.8),
+            # Unknown domains
+            ("https://random-blog.com/", 0.6),
+        ],
+    )
+    def test_estimate_source_reliability(self, agent, url, expected):
+        """Test source reliability by domain"""
+        assert agent._estimate_source_reliability(url) == expected
 
     def test_get_disclaimer_message(self, agent):
         """Test disclaimer message"""
@@ -144,28 +213,25 @@ class TestWebSearchAgent:
         assert "웹 검색" in message
         assert "외부 소스" in message or "외부" in message
 
-    @pytest.mark.asyncio
     async def test_evaluate_and_convert(self, agent, mock_llm_provider):
         """Test evaluation and conversion to documents"""
-        mock_llm_provider.generate_structured = AsyncMock(
-            return_value=WebResultRelevance(
-                content_relevance=0.8,
-                source_reliability=0.9,
-                information_completeness=0.8,
-                overall_score=0.8,
-                useful_excerpt="Useful content here",
-                should_include=True,
-            )
+        mock_llm_provider.generate_structured.return_value = WebResultRelevance.model_construct(
+            content_relevance=0.8,
+            source_reliability=0.9,
+            information_completeness=0.8,
+            overall_score=0.8,
+            useful_excerpt="Useful content here",
+            should_include=True,
         )
 
         results = [
-            TavilyResult(
+            TavilyResult.model_construct(
                 title="Result 1",
                 url="https://example.com/1",
                 content="Content 1",
                 score=0.9,
             ),
-            TavilyResult(
+            TavilyResult.model_construct(
                 title="Result 2",
                 url="https://example.com/2",
                 content="Content 2",
@@ -179,39 +245,32 @@ class TestWebSearchAgent:
         assert all(isinstance(d, Document) for d in documents)
         assert documents[0].metadata.source == "https://example.com/1"
 
-    @pytest.mark.asyncio
-    async def test_search_full_flow(self, agent, mock_llm_provider):
+    @pytest.mark.slow
+    async def test_search_full_flow(self, agent, mock_llm_provider, monkeypatch):
         """Test full search flow"""
         # Mock query optimization
-        mock_llm_provider.generate_structured = AsyncMock(
-            side_effect=[
-                OptimizedQuery(optimized_query="Docker guide", search_focus="docs"),
-                WebResultRelevance(
-                    content_relevance=0.8,
-                    source_reliability=0.9,
-                    information_completeness=0.8,
-                    overall_score=0.8,
-                    useful_excerpt="Docker content",
-                    should_include=True,
-                ),
-            ]
-        )
+        mock_llm_provider.generate_structured.side_effect = [
+            OptimizedQuery.model_construct(optimized_query="Docker guide", search_focus="docs"),
+            WebResultRelevance.model_construct(
+                content_relevance=0.8,
+                source_reliability=0.9,
+                information_completeness=0.8,
+                overall_score=0.8,
+                useful_excerpt="Docker content",
+                should_include=True,
+            ),
+        ]
+
+        # Stub Tavily API
+        async def tavily_search(*args, **kwargs):
+            return list(_TAVILY_RESULTS_DOCKER)
 
-        # Mock Tavily API
-        with patch.object(agent, "_tavily_search") as mock_tavily:
-            mock_tavily.return_value = [
-                TavilyResult(
-                    title="Docker Docs",
-                    url="https://docs.docker.com/",
-                    content="Docker documentation...",
-                    score=0.9,
-                )
-            ]
-
-            documents = await agent.search(
-                query="Docker 배포",
-                detected_domains=["docker"],
-                optimize_query=True,
-            )
+        monkeypatch.setattr(agent, "_tavily_search", tavily_search)
+
+        documents = await agent.search(
+            query="Docker 배포",
+            detected_domains=["docker"],
+            optimize_query=True,
+        )
 
         assert len(documents) >= 0  # May be 0 if filtering removes results